@@ -0,0 +1,62 @@
+"""
+Scrapes Google Flights result pages for a list of routes and dates into FlightData.txt
+
+    python -m FlightWebscraping --routes LAX-JFK,SLC-ATL --dates 2020-06-19,2020-06-20 --sessions 4
+    python -m FlightWebscraping --replay pages/ --output "" --store legs/ --solve LAX-JFK
+"""
+
+
+import argparse
+import os
+import sys
+import time
+
+from FlightWebscraping import ChromeBackend, ReplayBackend, makeRoutes, scrapeSchedule
+from MaxFlowAirport import buildEventNetwork, solve, writeScheduleData
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--routes", default="LAX-JFK", help="comma separated ORIGIN-DESTINATION pairs")
+    parser.add_argument("--dates", default="2020-06-19", help="comma separated YYYY-MM-DD dates")
+    parser.add_argument("--sessions", type=int, default=4, help="browser sessions (pages scraped at once)")
+    parser.add_argument("--replay", help="serve saved result pages from this directory instead of Chrome")
+    parser.add_argument("--record", help="save every scraped result page in this directory")
+    parser.add_argument("--driver", help="chromedriver executable")
+    parser.add_argument("--visible", action="store_true", help="show the browser windows")
+    parser.add_argument("--output", default=os.path.join(os.path.dirname(__file__), "FlightData.txt"),
+                        help="FlightData.txt file to write, empty to skip")
+    parser.add_argument("--store", help="save the legs of every page as JSON in this directory")
+    parser.add_argument("--default-seats", type=int,
+                        help="seats of aircraft types missing from the capacity table (default: skip their pages)")
+    parser.add_argument("--solve", help="ORIGIN-DESTINATION max flow to solve on the scraped schedule")
+    args = parser.parse_args(argv)
+
+    routes = makeRoutes([pair.split("-") for pair in args.routes.split(",")], args.dates.split(","))
+    if args.replay:
+        backend = ReplayBackend(args.replay)
+    else:
+        backend = ChromeBackend(args.driver, headless=not args.visible, record=args.record)
+
+    #adding the legs of every page to the schedule as soon as the page is scraped
+    began = time.perf_counter()
+    schedule, errors = scrapeSchedule(routes, backend, args.sessions, store=args.store,
+                                      default=args.default_seats)
+    seconds = time.perf_counter() - began
+    for route, error in errors.items():
+        print("failed %s: %r" % ("-".join(route), error), file=sys.stderr)
+    print("%d pages, %d legs in %.1fs (%.2f pages/s)" % (len(routes), len(schedule), seconds, len(routes) / seconds))
+
+    #writing flight data into text file
+    if args.output:
+        writeScheduleData(schedule, args.output)
+
+    if args.solve:
+        horizon = max(1440, int(schedule.arrival.max(initial=0)))
+        network = buildEventNetwork(schedule.unique(), *args.solve.split("-"), end=horizon)
+        print(solve(network, "dinic").value)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
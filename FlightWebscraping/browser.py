@@ -0,0 +1,108 @@
+"""
+Headless Chrome sessions for scraping Google Flights result pages
+
+A session keeps one browser open and loads route after route in it. Instead of sleeping for a fixed time after
+every click, each step waits until the page shows its effect: the results list after loading a route, more expand
+buttons after showing all flights and one more set of leg details after each expand click. The fields of every leg
+are then read by a single script run in the page, one WebDriver round trip per page instead of one per element.
+selenium is imported when the first session is opened, so the rest of the package works without it.
+"""
+
+
+import os
+
+from .scraper import DOMINATED_TOGGLE, EXPAND_BUTTON, LEG, LEG_DEPARTURE, LEG_FIELDS, flightsUrl, legRecord, routeName
+
+
+#text of the fields of every leg container, or of the n-th element of each field when the page has no containers
+EXTRACT_LEGS = """
+var fields = arguments[1];
+var text = function (element) { return element ? element.innerText : ""; };
+var legs = document.getElementsByClassName(arguments[0]);
+if (legs.length) {
+    return Array.prototype.map.call(legs, function (leg) {
+        return fields.map(function (name) { return text(leg.getElementsByClassName(name)[0]); });
+    });
+}
+var columns = fields.map(function (name) { return document.getElementsByClassName(name); });
+var rows = [];
+for (var i = 0; i < columns[0].length; i++) {
+    rows.push(columns.map(function (column) { return text(column[i]); }));
+}
+return rows;
+"""
+
+
+class ChromeBackend:
+    """
+    Opens Chrome sessions, headless unless headless=False
+
+    driverPath is the chromedriver executable (found on the PATH by default) and timeout the longest wait for a
+    page to react in seconds. With record set to a directory, every scraped page is saved there for replay.
+    """
+
+    def __init__(self, driverPath=None, headless=True, timeout=20, record=None, airlines=None, excluded=None):
+        self.driverPath = driverPath
+        self.headless = headless
+        self.timeout = timeout
+        self.record = record
+        self.urlOptions = {name: value for name, value in (("airlines", airlines), ("excluded", excluded))
+                           if value is not None}
+
+    def open(self):
+        from selenium import webdriver
+        from selenium.webdriver.chrome.service import Service
+
+        options = webdriver.ChromeOptions()
+        if self.headless:
+            options.add_argument("--headless=new")
+        options.add_argument("--window-size=1920,1080")
+        service = Service(self.driverPath) if self.driverPath else Service()
+        return ChromeSession(webdriver.Chrome(service=service, options=options), self)
+
+
+class ChromeSession:
+
+    def __init__(self, driver, backend):
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support.ui import WebDriverWait
+
+        self.driver = driver
+        self.backend = backend
+        self.by = By.CLASS_NAME
+        self.wait = WebDriverWait(driver, backend.timeout)
+
+    def count(self, className):
+        return len(self.driver.find_elements(self.by, className))
+
+    def scrape(self, route):
+        """Loads the results page of a route, expands every flight and returns its legs"""
+        driver = self.driver
+        driver.get(flightsUrl(route, **self.backend.urlOptions))
+        self.wait.until(lambda d: d.find_elements(self.by, EXPAND_BUTTON) or d.find_elements(self.by, DOMINATED_TOGGLE))
+
+        #show all flights, then wait for their expand buttons
+        toggles = driver.find_elements(self.by, DOMINATED_TOGGLE)
+        if toggles:
+            shown = self.count(EXPAND_BUTTON)
+            toggles[0].click()
+            self.wait.until(lambda d: len(d.find_elements(self.by, EXPAND_BUTTON)) > shown)
+
+        #expand every flight, waiting for its leg details to appear before the next click
+        for button in driver.find_elements(self.by, EXPAND_BUTTON):
+            legs = self.count(LEG_DEPARTURE)
+            driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", button)
+            button.click()
+            self.wait.until(lambda d: len(d.find_elements(self.by, LEG_DEPARTURE)) > legs)
+
+        rows = driver.execute_script(EXTRACT_LEGS, LEG, list(LEG_FIELDS))
+        legs = [legRecord(*row) for row in rows if row[0] and row[1]]
+
+        if self.backend.record:
+            os.makedirs(self.backend.record, exist_ok=True)
+            with open(os.path.join(self.backend.record, routeName(route) + ".html"), "w", encoding="utf-8") as f:
+                f.write(driver.page_source)
+        return legs
+
+    def close(self):
+        self.driver.quit()
@@ -0,0 +1,132 @@
+"""
+Offline replay of saved Google Flights result pages
+
+ReplayBackend serves result pages saved as ROUTE.html (e.g. LAX-JFK-2020-06-19.html) in a directory, either
+recorded by a ChromeBackend with record set or written by writeReplayPage from known legs. The legs are read back
+in a single pass over the page source with the standard library HTML parser, field by field within each leg
+container like the in-page script of a live session, one line of text per text node. A delay per page can stand in
+for the network and rendering time of a real browser when benchmarking the concurrency of a scrape.
+"""
+
+
+from html import escape
+from html.parser import HTMLParser
+import os
+import time
+
+from .scraper import (AIRCRAFT_TYPE, FLIGHT_INFO, LEG, LEG_ARRIVAL, LEG_DEPARTURE, LEG_FIELDS, legLines, legRecord,
+                      routeName)
+
+
+VOID_TAGS = {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source", "track", "wbr"}
+
+
+class LegParser(HTMLParser):
+    """
+    Collects the text of the field elements of a page, per leg container (rows) and by class name in page order
+    (texts) for pages without containers
+    """
+
+    def __init__(self, container, fields):
+        super().__init__()
+        self.container = container
+        self.texts = {className: [] for className in fields}
+        self.rows = []
+        self.open = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag in VOID_TAGS:
+            return
+        for capture in self.open:
+            capture[1] += 1
+        for name, value in attrs:
+            if name == "class" and value:
+                for className in value.split():
+                    if className == self.container:
+                        self.rows.append({})
+                        self.open.append([className, 1, None])
+                    elif className in self.texts:
+                        self.open.append([className, 1, []])
+
+    def handle_endtag(self, tag):
+        if tag in VOID_TAGS:
+            return
+        for capture in self.open:
+            capture[1] -= 1
+        inLeg = any(capture[2] is None for capture in self.open)
+        for className, depth, chunks in self.open:
+            if depth <= 0 and chunks is not None:
+                text = "\n".join(chunks)
+                self.texts[className].append(text)
+                if inLeg:
+                    self.rows[-1].setdefault(className, text)
+        self.open = [capture for capture in self.open if capture[1] > 0]
+
+    def handle_data(self, data):
+        data = " ".join(data.split())
+        if data:
+            for capture in self.open:
+                if capture[2] is not None:
+                    capture[2].append(data)
+
+
+def parseLegs(page):
+    """Legs of a result page's HTML source"""
+    parser = LegParser(LEG, LEG_FIELDS)
+    parser.feed(page)
+    parser.close()
+    if parser.rows:
+        rows = [[row.get(field, "") for field in LEG_FIELDS] for row in parser.rows]
+    else:
+        columns = [parser.texts[field] for field in LEG_FIELDS]
+        rows = [[column[i] if i < len(column) else "" for column in columns] for i in range(len(columns[0]))]
+    return [legRecord(*row) for row in rows if row[0] and row[1]]
+
+
+def replayPage(legs):
+    """Minimal result page HTML holding the given legs in the class names of the live page"""
+    block = lambda className, lines: '<div class="%s">%s</div>' % (
+        className, "".join("<div>%s</div>" % escape(line) for line in lines))
+    rows = []
+    for leg in legs:
+        departure, origin, arrival, destination, aircraft = legLines(leg)
+        rows.append('<div class="%s">%s%s%s%s</div>' % (
+            LEG, block(LEG_DEPARTURE, [departure, origin]), block(LEG_ARRIVAL, [arrival, destination]),
+            block(AIRCRAFT_TYPE, [aircraft]), block(FLIGHT_INFO, [leg.flightNumber[:2] + " " + leg.flightNumber[2:]]
+                                                    if leg.flightNumber else [])))
+    return "<html><body>\n%s\n</body></html>\n" % "\n".join(rows)
+
+
+def writeReplayPage(directory, route, legs):
+    os.makedirs(directory, exist_ok=True)
+    with open(os.path.join(directory, routeName(route) + ".html"), "w", encoding="utf-8") as f:
+        f.write(replayPage(legs))
+
+
+class ReplayBackend:
+    """Sessions serving the saved pages in a directory, each page taking at least delay seconds"""
+
+    def __init__(self, directory, delay=0):
+        self.directory = directory
+        self.delay = delay
+
+    def open(self):
+        return ReplaySession(self)
+
+
+class ReplaySession:
+
+    def __init__(self, backend):
+        self.backend = backend
+
+    def scrape(self, route):
+        began = time.perf_counter()
+        with open(os.path.join(self.backend.directory, routeName(route) + ".html"), encoding="utf-8") as f:
+            legs = parseLegs(f.read())
+        remaining = self.backend.delay - (time.perf_counter() - began)
+        if remaining > 0:
+            time.sleep(remaining)
+        return legs
+
+    def close(self):
+        pass
@@ -0,0 +1,270 @@
+"""
+Concurrent scraping of Google Flights result pages for many routes and dates
+
+Every route (origin, destination, date) is one results page. Pages are scraped by a thread pool over a bounded
+pool of reusable sessions from a backend: headless Chrome sessions (browser.ChromeBackend) that are opened once and
+then navigate from page to page, or replay sessions (replay.ReplayBackend) that serve saved result pages from disk
+so that a scrape can be rerun, tested and benchmarked offline. A session that fails is closed and replaced, and its
+route is retried on a fresh one.
+
+Every leg is read in one pass as the text of its departure, arrival, aircraft type and flight details elements and
+turned into a structured Leg: times in minutes since midnight (an arrival before the departure lands the next
+day), IATA codes and airport names, aircraft type and flight number.
+
+iterPages yields the legs of each page as soon as it is scraped, so scrapeSchedule adds them to the columns of a
+ScheduleBuilder while the other pages are still loading and the schedule is ready for buildEventNetwork when the
+last page finishes, without going through FlightData.txt. With a store directory every page that is kept is also
+saved as one JSON file written atomically (to a temporary file that is then renamed), so an interrupted scrape never
+leaves a partly written page behind and readPages can rebuild the schedule later.
+"""
+
+
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import datetime
+import json
+import os
+import queue
+import re
+import tempfile
+import threading
+import time
+
+from MaxFlowAirport.flightdata import (SEAT_CAPACITY, ScheduleBuilder, parseAirport, parseTime, recordLines,
+                                       seatCapacity, writeRecords)
+
+
+#class names of the result page elements
+DOMINATED_TOGGLE = "gws-flights-results__dominated-toggle"
+EXPAND_BUTTON = "gws-flights-results__expand"
+LEG = "gws-flights-results__leg"
+LEG_DEPARTURE = "gws-flights-results__leg-departure"
+LEG_ARRIVAL = "gws-flights-results__leg-arrival"
+AIRCRAFT_TYPE = "gws-flights-results__aircraft-type"
+FLIGHT_INFO = "gws-flights-results__other-leg-info"
+
+#fields read for every leg, in the order of the legRecord arguments
+LEG_FIELDS = (LEG_DEPARTURE, LEG_ARRIVAL, AIRCRAFT_TYPE, FLIGHT_INFO)
+
+#airline designator and number, e.g. DL 1234 (the space keeps aircraft types like A321 from matching)
+FLIGHT_NUMBER = re.compile(r"\b([A-Z][A-Z0-9]|[0-9][A-Z])\s(\d{1,4})\b")
+
+#airlines searched and connecting airports left out of the original LAX -> JFK search
+AIRLINES = ("AA", "DL", "UA", "WN", "AS")
+EXCLUDED = ("DCA", "TPA", "PDX", "FLL", "BOS", "MSP", "SJC", "SMF", "TUS")
+
+
+Route = namedtuple("Route", ["origin", "destination", "date"])
+Leg = namedtuple("Leg", ["departure", "origin", "originName", "arrival", "destination", "destinationName", "aircraft",
+                         "flightNumber"])
+ScrapeReport = namedtuple("ScrapeReport", ["routes", "legs", "errors", "seconds", "pagesPerSecond"])
+
+
+def flightsUrl(route, airlines=AIRLINES, excluded=EXCLUDED):
+    """Google Flights one way results page of a route, e.g. LAX.JFK.2020-06-19"""
+    return ("https://www.google.com/flights?hl=en#flt=%s.%s.%s;c:USD;e:1;ca:%s;a:%s;sd:1;t:f;tt:o" % (
+        route.origin, route.destination, route.date, ",".join("-" + code for code in excluded), ",".join(airlines)))
+
+
+def routeName(route):
+    """File name friendly name of a route, e.g. LAX-JFK-2020-06-19"""
+    return "%s-%s-%s" % route
+
+
+def legRecord(departure, arrival, aircraft, info=""):
+    """
+    Leg of the text of its departure and arrival elements (a time line over an airport line such as 'Los Angeles
+    International Airport LAX'), its aircraft type and its flight details, searched for a flight number such as
+    'DL 1234' (None if there is none); a leg without an aircraft type is rejected, as it has no seats
+    """
+    aircraft = " ".join((aircraft or "").split())
+    if not aircraft:
+        raise ValueError("leg %r -> %r has no aircraft type" % (departure.strip(), arrival.strip()))
+    leaving = [line.strip() for line in departure.split("\n") if line.strip()]
+    arriving = [line.strip() for line in arrival.split("\n") if line.strip()]
+    minutes, landing = parseTime(leaving[0]), parseTime(arriving[0])
+    if landing < minutes:
+        landing += 1440
+    origin, originName = parseAirport(leaving[-1])
+    destination, destinationName = parseAirport(arriving[-1])
+    number = FLIGHT_NUMBER.search(info or "")
+    return Leg(minutes, origin, originName, landing, destination, destinationName, aircraft,
+               number.group(1) + number.group(2) if number else None)
+
+
+def legLines(leg):
+    """The five lines of a leg's FlightData.txt record"""
+    return recordLines(leg.departure, leg.origin, leg.originName, leg.arrival, leg.destination, leg.destinationName,
+                       leg.aircraft)
+
+
+def makeRoutes(pairs, dates):
+    """Every (origin, destination) pair on every date"""
+    return [Route(origin, destination, date) for date in dates for origin, destination in pairs]
+
+
+class SessionPool:
+    """
+    At most size sessions of a backend, opened on first use and handed out to one thread at a time
+
+    Sessions are reused across routes, so the browser start up cost is paid once per session and not per page.
+    """
+
+    def __init__(self, backend, size):
+        self.backend = backend
+        self.size = size
+        self.idle = queue.LifoQueue()
+        self.opened = 0
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        with self.lock:
+            if self.idle.empty() and self.opened < self.size:
+                self.opened += 1
+                create = True
+            else:
+                create = False
+        if not create:
+            return self.idle.get()
+        try:
+            return self.backend.open()
+        except BaseException:
+            with self.lock:
+                self.opened -= 1
+            raise
+
+    def release(self, session):
+        self.idle.put(session)
+
+    def discard(self, session):
+        """Closes a broken session and frees its slot"""
+        with self.lock:
+            self.opened -= 1
+        try:
+            session.close()
+        except Exception:
+            pass
+
+    def close(self):
+        while not self.idle.empty():
+            session = self.idle.get()
+            with self.lock:
+                self.opened -= 1
+            session.close()
+
+
+def scrapeRoute(pool, route, retries=1):
+    """Legs of one route scraped on a pooled session, retried on a new session if the page fails"""
+    for attempt in range(retries + 1):
+        session = pool.acquire()
+        try:
+            legs = session.scrape(route)
+        except Exception:
+            pool.discard(session)
+            if attempt == retries:
+                raise
+        else:
+            pool.release(session)
+            return legs
+
+
+def iterPages(routes, backend, sessions=4, retries=1, store=None, check=None):
+    """
+    Scrapes every route with up to sessions pages in flight at once, yielding (route, legs, error) as pages finish
+
+    legs is None and error the exception for a route that failed every attempt or whose legs check (a function of
+    the legs of a page) raised on. With store set, the legs of every accepted page are saved there (savePage) before
+    the page is yielded.
+    """
+    pool = SessionPool(backend, max(1, sessions))
+    try:
+        with ThreadPoolExecutor(max(1, sessions)) as executor:
+            futures = {executor.submit(scrapeRoute, pool, Route(*route), retries): Route(*route) for route in routes}
+            for future in as_completed(futures):
+                route = futures[future]
+                try:
+                    legs = future.result()
+                    if check is not None:
+                        check(legs)
+                except Exception as error:
+                    yield route, None, error
+                    continue
+                if store:
+                    savePage(store, route, legs)
+                yield route, legs, None
+    finally:
+        pool.close()
+
+
+def scrapeRoutes(routes, backend, sessions=4, retries=1, store=None):
+    """
+    Scrapes every route with up to sessions pages in flight at once
+
+    Returns a ScrapeReport with the routes, their legs in route order (None for a route that failed every attempt),
+    the errors by route and the throughput in pages per second.
+    """
+    routes = [Route(*route) for route in routes]
+    pages = {}
+    errors = {}
+    began = time.perf_counter()
+    for route, legs, error in iterPages(routes, backend, sessions, retries, store):
+        pages[route] = legs
+        if error is not None:
+            errors[route] = error
+    seconds = time.perf_counter() - began
+    return ScrapeReport(routes, [pages[route] for route in routes], errors, seconds,
+                        len(routes) / seconds if seconds > 0 else float("inf"))
+
+
+def scrapeSchedule(routes, backend, sessions=4, retries=1, store=None, capacities=SEAT_CAPACITY, default=None):
+    """
+    Scrapes every route straight into a Schedule, adding the legs of each page as soon as it finishes
+
+    Times are in minutes since midnight of the earliest date, so the pages of a week of dates form one multi-day
+    schedule. A page with an aircraft type missing from capacities (and no default seats) is left out, not stored,
+    and recorded as an error of its route like a failed page. Returns the schedule and the errors by route.
+    """
+    routes = [Route(*route) for route in routes]
+    first = min((datetime.date.fromisoformat(route.date) for route in routes), default=None)
+    builder = ScheduleBuilder(capacities, default)
+    errors = {}
+
+    def checkSeats(legs):
+        #every leg of the page needs seats before any of them is added (or the page is stored)
+        for aircraft in {leg.aircraft for leg in legs}:
+            seatCapacity(aircraft, capacities, default)
+
+    for route, legs, error in iterPages(routes, backend, sessions, retries, store, checkSeats):
+        if error is not None:
+            errors[route] = error
+            continue
+        offset = (datetime.date.fromisoformat(route.date) - first).days * 1440
+        builder.extend(leg._replace(departure=leg.departure + offset, arrival=leg.arrival + offset) for leg in legs)
+    return builder.schedule(), errors
+
+
+def savePage(directory, route, legs):
+    """Saves the legs of a page as ROUTE.json in one atomic write"""
+    os.makedirs(directory, exist_ok=True)
+    descriptor, temporary = tempfile.mkstemp(suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(descriptor, "w", encoding="utf-8") as f:
+            json.dump(dict(route=list(route), fields=list(Leg._fields), legs=[list(leg) for leg in legs]), f)
+        os.replace(temporary, os.path.join(directory, routeName(route) + ".json"))
+    except BaseException:
+        os.unlink(temporary)
+        raise
+
+
+def readPages(directory):
+    """Yields (route, legs) for every page saved in a directory by savePage"""
+    for name in sorted(os.listdir(directory)):
+        if name.endswith(".json"):
+            with open(os.path.join(directory, name), encoding="utf-8") as f:
+                page = json.load(f)
+            yield Route(*page["route"]), [Leg(**dict(zip(page["fields"], leg))) for leg in page["legs"]]
+
+
+def writeFlightData(legs, path):
+    """Writes scraped legs in the 5-line record format of FlightData.txt"""
+    writeRecords((legLines(leg) for leg in legs), path)
@@ -0,0 +1,23 @@
+"""
+Prints the max flow of passengers from LAX to JFK within the 24 hour period of the shipped flight schedule
+"""
+
+
+import os
+import pulp as p
+
+from MaxFlowAirport import readSchedule, buildNetwork, buildProblem
+
+
+def main():
+    flights = readSchedule(os.path.join(os.path.dirname(__file__), "FlightSchedule.csv"))
+    network = buildNetwork(flights, "LAX", "JFK", start=1, end=24)
+    airportFlow, edges = buildProblem(network)
+
+    #print max flow
+    airportFlow.solve()
+    print(p.value(airportFlow.objective))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+Batched max flow queries between many origin and destination airports
+
+A single event network of the whole schedule answers every (source, sink, window) query: since every arc moves
+forward in time, the flow from the first event of the source at or after the start of the window to the last event
+of the sink at or before its end only ever uses flights inside the window. The event network of the query itself
+(buildEventNetwork over the window) starts at the source at the start of the window and ends at the sink at its
+end; when either is not an event, all of the flow passes one waiting arc of the ground capacity there, so the
+value of such a query is capped at the ground capacity. The network is built once and handed to a pool of worker
+processes, which with the fork start method inherit its arrays read-only instead of receiving a copy. Each worker
+keeps one residual graph and resets it between queries, so a query costs one Dinic solve.
+"""
+
+
+from collections import namedtuple
+import multiprocessing
+import time
+
+from .maxflow import ResidualGraph
+
+
+Query = namedtuple("Query", ["source", "sink", "window"])
+BatchReport = namedtuple("BatchReport", ["queries", "values", "seconds", "queriesPerSecond"])
+
+_network = None
+_graph = None
+_groundCapacity = None
+
+
+def normalizeQuery(query, horizon):
+    """Turns (source, sink) or (source, sink, (start, end)) into a Query with an explicit window"""
+    source, sink = query[0], query[1]
+    window = query[2] if len(query) > 2 and query[2] is not None else horizon
+    return Query(source, sink, (int(window[0]), int(window[1])))
+
+
+def allPairs(airports, window=None):
+    """Every ordered (source, sink, window) query between distinct airports"""
+    return [Query(source, sink, window) for source in airports for sink in airports if source != sink]
+
+
+def windowNodes(network, source, sink, window):
+    """
+    First node of source at or after the start of window, last node of sink at or before its end (-1 if none) and
+    whether both lie exactly on the window edges (else the query network caps the flow at the ground capacity)
+    """
+    first, last = network.firstNode(source, window[0]), network.lastNode(sink, window[1])
+    exact = first >= 0 and last >= 0 and network.nodeTime[first] == window[0] and network.nodeTime[last] == window[1]
+    return first, last, bool(exact)
+
+
+def runPool(function, items, initializer, initargs=(), processes=None, chunksize=None):
+    """
+    Maps function over items in a pool of processes (one per CPU by default) each set up by initializer(*initargs),
+    or in this process for processes=1 or a single item
+
+    With the fork start method the workers inherit the initializer arguments read-only instead of receiving a copy.
+    """
+    items = list(items)
+    processes = processes or multiprocessing.cpu_count()
+    if processes == 1 or len(items) <= 1:
+        initializer(*initargs)
+        return [function(item) for item in items]
+    methods = multiprocessing.get_all_start_methods()
+    context = multiprocessing.get_context("fork" if "fork" in methods else None)
+    chunksize = chunksize or max(1, len(items) // (4 * processes))
+    with context.Pool(processes, initializer=initializer, initargs=initargs) as pool:
+        return pool.map(function, items, chunksize)
+
+
+def initWorker(network, groundCapacity=None):
+    global _network, _graph, _groundCapacity
+    _network = network
+    _graph = None
+    _groundCapacity = groundCapacity
+
+
+def runQuery(query):
+    """Max flow of one normalized query on the network of this process"""
+    global _graph
+    source, sink, exact = windowNodes(_network, query.source, query.sink, query.window)
+    if source < 0 or sink < 0 or query.source == query.sink:
+        return 0
+    if _graph is None:
+        _graph = ResidualGraph(_network)
+    else:
+        _graph.reset()
+    value = _graph.maxFlow(source, sink)
+    return value if exact or _groundCapacity is None else min(value, _groundCapacity)
+
+
+def maxFlowBatch(network, queries, processes=None, chunksize=None, groundCapacity=None):
+    """
+    Solves a list of (source, sink) or (source, sink, (start, end)) queries on one network
+
+    network should be an event network of the whole schedule (buildEventNetwork or loadNetwork(events=True)).
+    Queries without a window use the full horizon of the network. groundCapacity is the one the network was built
+    with (by default the capacity of its waiting arcs); every value equals the max flow of buildEventNetwork over
+    the query window with it. processes=1 runs the queries in this process. Returns a BatchReport with the values
+    in query order and the throughput in queries per second.
+    """
+    horizon = (int(network.nodeTime.min()), int(network.nodeTime.max())) if network.numNodes else (0, 0)
+    queries = [normalizeQuery(query, horizon) for query in queries]
+    groundCapacity = network.groundCapacity if groundCapacity is None else groundCapacity
+    began = time.perf_counter()
+    values = runPool(runQuery, queries, initWorker, (network, groundCapacity), processes, chunksize)
+
+    seconds = time.perf_counter() - began
+    return BatchReport(queries, values, seconds, len(queries) / seconds if seconds > 0 else float("inf"))
@@ -0,0 +1,144 @@
+"""
+Scaling benchmark of the max flow pipeline on synthetic hub-and-spoke schedules
+
+Every case generates a schedule, writes it in the FlightData.txt format and times each phase of the pipeline for
+every backend: parse (readFlightData), build (buildEventNetwork), model (PuLP problem, residual graph or sparse
+matrices), solve and extract (value and arc flows). The backends must agree on the max flow value. The memory held
+by each network's arrays is recorded with it (bytes and bytes per arc). Results are written as JSON and can be
+compared with the results of an earlier run to flag phases that got slower.
+
+    python -m MaxFlowAirport.benchmark --sizes 20x200,100x2000 --output bench.json --baseline old.json
+"""
+
+
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import numpy as np
+
+from .flightdata import readFlightData, writeScheduleData
+from .network import buildEventNetwork
+from .solver import BACKENDS, buildModel, extractResult, loadBackend, solveModel
+from .synthetic import syntheticSchedule
+
+
+PHASES = ["parse", "build", "model", "solve", "extract"]
+DEFAULT_SIZES = [(20, 200), (100, 2000), (300, 20000)]
+
+
+def busiestPair(schedule):
+    """Airport with the most departures and a different airport with the most arrivals"""
+    departures = np.bincount(schedule.origin, minlength=len(schedule.airports))
+    arrivals = np.bincount(schedule.destination, minlength=len(schedule.airports))
+    source = int(departures.argmax())
+    arrivals[source] = -1
+    return schedule.airports[source], schedule.airports[int(arrivals.argmax())]
+
+
+def timed(phases, phase, function, *args):
+    began = time.perf_counter()
+    value = function(*args)
+    phases[phase] = time.perf_counter() - began
+    return value
+
+
+def runCase(airports, flights, backends=BACKENDS, seed=0, pulpLimit=50000):
+    """Times every phase of one synthetic case for each backend; PuLP is skipped above pulpLimit arcs"""
+    schedule = syntheticSchedule(airports, flights, seed=seed)
+    source, sink = busiestPair(schedule)
+    shared = {}
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "FlightData.txt")
+        writeScheduleData(schedule, path)
+        parsed = timed(shared, "parse", readFlightData, path)
+    network = timed(shared, "build", buildEventNetwork, parsed, source, sink)
+
+    runs = []
+    for backend in backends:
+        if backend == "pulp" and network.numArcs > pulpLimit:
+            continue
+        phases = dict(shared)
+        #a first highs case would otherwise time the SciPy import as part of its model and solve
+        loadBackend(backend)
+        model = timed(phases, "model", buildModel, network, backend)
+        timed(phases, "solve", solveModel, network, model, backend)
+        result = timed(phases, "extract", extractResult, network, model, backend)
+        runs.append(dict(airports=airports, flights=flights, seed=seed, source=source, sink=sink,
+                         nodes=network.numNodes, arcs=network.numArcs, bytes=network.nbytes,
+                         bytesPerArc=network.bytesPerArc, backend=backend, value=float(result.value), phases=phases,
+                         total=sum(phases.values())))
+    return runs
+
+
+def runSuite(sizes=DEFAULT_SIZES, backends=BACKENDS, seed=0, pulpLimit=50000):
+    """Runs every (airports, flights) case and checks that the backends agree on each max flow value"""
+    runs = []
+    disagreements = []
+    for airports, flights in sizes:
+        case = runCase(airports, flights, backends, seed, pulpLimit)
+        values = {run["backend"]: run["value"] for run in case}
+        if max(values.values()) - min(values.values()) > 1e-6:
+            disagreements.append(dict(airports=airports, flights=flights, values=values))
+        runs.extend(case)
+    return dict(python=platform.python_version(), machine=platform.machine(), time=time.time(), runs=runs,
+                disagreements=disagreements)
+
+
+def compareResults(baseline, current, tolerance=0.25, minimum=0.01):
+    """Phases of current runs that are more than tolerance slower than the same case in baseline"""
+    key = lambda run: (run["airports"], run["flights"], run["seed"], run["backend"])
+    before = {key(run): run for run in baseline["runs"]}
+    regressions = []
+    for run in current["runs"]:
+        old = before.get(key(run))
+        if old is None:
+            continue
+        for phase in PHASES:
+            was, now = old["phases"].get(phase), run["phases"].get(phase)
+            if was is not None and now is not None and now > minimum and now > was * (1 + tolerance):
+                regressions.append(dict(airports=run["airports"], flights=run["flights"], backend=run["backend"],
+                                        phase=phase, baseline=was, current=now))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", default=",".join("%dx%d" % size for size in DEFAULT_SIZES),
+                        help="comma separated AIRPORTSxFLIGHTS cases")
+    parser.add_argument("--backends", default=",".join(BACKENDS))
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--pulp-limit", type=int, default=50000, help="largest network (arcs) solved with PuLP")
+    parser.add_argument("--output", help="write the results as JSON to this file")
+    parser.add_argument("--baseline", help="JSON results of an earlier run to check for regressions")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    args = parser.parse_args(argv)
+
+    sizes = [tuple(int(n) for n in size.split("x")) for size in args.sizes.split(",")]
+    results = runSuite(sizes, args.backends.split(","), args.seed, args.pulp_limit)
+    for run in results["runs"]:
+        print("%5d airports %7d flights %8d arcs %5.1f B/arc %-6s value %10.0f  " % (
+            run["airports"], run["flights"], run["arcs"], run["bytesPerArc"], run["backend"], run["value"]) +
+            " ".join("%s %.3fs" % (phase, run["phases"][phase]) for phase in PHASES))
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=1)
+
+    failed = bool(results["disagreements"])
+    for disagreement in results["disagreements"]:
+        print("backends disagree:", disagreement)
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compareResults(json.load(f), results, args.tolerance)
+        for regression in regressions:
+            print("regression: %(backend)s %(phase)s %(airports)dx%(flights)d %(baseline).3fs -> %(current).3fs"
+                  % regression)
+        failed = failed or bool(regressions)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
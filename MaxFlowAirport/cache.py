@@ -0,0 +1,150 @@
+"""
+Content-hashed binary cache of parsed schedules and built networks
+
+Parsing FlightData.txt and building its time-expanded network is repeated work once a schedule reaches national
+scale. The first run stores the schedule columns and the network arrays (including the CSR adjacency) as .npy files
+in a __flightcache__ directory next to the source file, and later runs or other processes open them memory-mapped
+without parsing and without copying them into the heap. Every entry is keyed by a hash of the file contents and of
+the parameters used to build it, so a changed file or a different build never hits a stale entry, and entries left
+behind by an older version of the file are removed when the new one is stored.
+"""
+
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import numpy as np
+
+from .flightdata import SEAT_CAPACITY, readFlightData
+from .network import FlightNetwork, buildEventNetwork, buildNetwork
+from .schedule import Schedule
+
+
+VERSION = 3
+SCHEDULE_ARRAYS = ["origin", "departure", "destination", "arrival", "capacity", "aircraft"]
+NETWORK_ARRAYS = ["nodeAirport", "nodeTime", "tail", "head", "capacity", "flight", "outStart", "outArcs", "inStart",
+                  "inArcs"]
+
+
+def fileHash(path):
+    """Hex digest of the contents of a file, read in blocks"""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def scheduleHash(schedule):
+    """Hex digest of the airports and flight columns of a schedule (a Schedule or a sequence of flights)"""
+    schedule = schedule if isinstance(schedule, Schedule) else Schedule.fromFlights(schedule)
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(json.dumps(list(schedule.airports)).encode())
+    for column in (schedule.origin, schedule.departure, schedule.destination, schedule.arrival, schedule.capacity):
+        digest.update(np.ascontiguousarray(column, dtype=np.int32).tobytes())
+    return digest.hexdigest()
+
+
+def paramHash(**params):
+    """Hex digest of build parameters, independent of keyword order"""
+    text = json.dumps([VERSION, params], sort_keys=True, default=str)
+    return hashlib.blake2b(text.encode(), digest_size=8).hexdigest()
+
+
+def cacheDirectory(path, directory=None):
+    return directory or os.path.join(os.path.dirname(os.path.abspath(path)), "__flightcache__")
+
+
+def saveArrays(entry, arrays, meta):
+    """Writes the arrays and JSON metadata of an entry into a temporary directory and renames it into place"""
+    parent = os.path.dirname(entry)
+    os.makedirs(parent, exist_ok=True)
+    scratch = tempfile.mkdtemp(dir=parent, prefix=".tmp-")
+    try:
+        for name, values in arrays.items():
+            np.save(os.path.join(scratch, name + ".npy"), np.ascontiguousarray(values))
+        with open(os.path.join(scratch, "meta.json"), "w") as f:
+            json.dump(meta, f)
+        os.rename(scratch, entry)
+    except OSError:
+        #another process stored the same entry first
+        shutil.rmtree(scratch, ignore_errors=True)
+        if not os.path.isdir(entry):
+            raise
+
+
+def loadArrays(entry, names):
+    """Opens the arrays of an entry memory-mapped read-only, or returns None if the entry is missing"""
+    try:
+        with open(os.path.join(entry, "meta.json")) as f:
+            meta = json.load(f)
+        arrays = {name: np.load(os.path.join(entry, name + ".npy"), mmap_mode="r") for name in names}
+    except (OSError, ValueError):
+        return None
+    return arrays, meta
+
+
+def removeStale(directory, name, digest):
+    """Removes the entries stored for other contents of the source file name"""
+    if not os.path.isdir(directory):
+        return
+    for entry in os.listdir(directory):
+        rest = entry[len(name) + 1:]
+        if entry.startswith(name + ".") and rest.count(".") == 1 and not rest.startswith(digest + "."):
+            shutil.rmtree(os.path.join(directory, entry), ignore_errors=True)
+
+
+def entryPath(path, kind, params, directory=None, digest=None):
+    digest = digest or fileHash(path)
+    name = os.path.basename(path)
+    return os.path.join(cacheDirectory(path, directory), "%s.%s.%s-%s" % (name, digest, kind, paramHash(**params)))
+
+
+def loadSchedule(path, capacities=SEAT_CAPACITY, default=None, unique=True, directory=None, digest=None):
+    """Returns the memory-mapped Schedule of a FlightData.txt file, parsing and storing it on a cache miss"""
+    digest = digest or fileHash(path)
+    entry = entryPath(path, "schedule", dict(capacities=capacities, default=default, unique=unique), directory,
+                      digest)
+    cached = loadArrays(entry, SCHEDULE_ARRAYS)
+    if cached is None:
+        schedule = readFlightData(path, capacities, default)
+        if unique:
+            schedule = schedule.unique()
+        removeStale(os.path.dirname(entry), os.path.basename(path), digest)
+        saveArrays(entry, {name: getattr(schedule, name) for name in SCHEDULE_ARRAYS},
+                   dict(airports=schedule.airports, aircraftTypes=schedule.aircraftTypes,
+                        airportNames=schedule.airportNames))
+        cached = loadArrays(entry, SCHEDULE_ARRAYS)
+    arrays, meta = cached
+    return Schedule(meta["airports"], *(arrays[name] for name in SCHEDULE_ARRAYS[:5]), arrays["aircraft"],
+                    meta["aircraftTypes"], meta["airportNames"])
+
+
+def loadNetwork(path, source, sink, events=False, capacities=SEAT_CAPACITY, default=None, unique=True, directory=None,
+                **params):
+    """
+    Returns the memory-mapped network of a FlightData.txt file, building and storing it on a cache miss
+
+    The network is built by buildEventNetwork when events is set and by buildNetwork (hourly, step=60 unless given)
+    otherwise, with the remaining keyword arguments (start, end, groundCapacity, ...) passed on to the builder.
+    """
+    digest = fileHash(path)
+    schedule = loadSchedule(path, capacities, default, unique, directory, digest)
+    if not events:
+        params.setdefault("step", 60)
+    key = dict(params, source=source, sink=sink, events=events, capacities=capacities, default=default, unique=unique)
+    entry = entryPath(path, "network", key, directory, digest)
+    cached = loadArrays(entry, NETWORK_ARRAYS)
+    if cached is None:
+        build = buildEventNetwork if events else buildNetwork
+        network = build(schedule, source, sink, **params)
+        saveArrays(entry, {name: getattr(network, name) for name in NETWORK_ARRAYS},
+                   dict(airports=network.airports, source=int(network.source), sink=int(network.sink),
+                        clock=network.clock))
+        cached = loadArrays(entry, NETWORK_ARRAYS)
+    arrays, meta = cached
+    return FlightNetwork(meta["airports"], arrays["nodeAirport"], arrays["nodeTime"], arrays["tail"], arrays["head"],
+                         arrays["capacity"], arrays["flight"], schedule, meta["source"], meta["sink"],
+                         arrays["outStart"], arrays["outArcs"], arrays["inStart"], arrays["inArcs"], meta["clock"])
@@ -0,0 +1,234 @@
+"""
+Streaming parser for the flight data written by the FlightWebscraping module
+
+FlightData.txt stores one leg per record: departure time, origin airport name + IATA code, arrival time,
+destination airport name + IATA code, aircraft type and a blank line, e.g.
+
+     3:20 PM
+    Los Angeles International Airport LAX
+    11:40 PM
+    John F. Kennedy International Airport JFK
+    Boeing 767
+
+The file is read one line at a time into typed arrays, so memory grows only with the compact columns of the
+schedule and not with the text. Times become minutes since midnight (a "+1" day marker or an arrival earlier than
+the departure moves the arrival to the next day) and aircraft types are mapped to seat capacities through a lookup
+table that can be replaced or extended by the caller. Legs that are already parsed, such as the records streamed
+by the scraper, are added one at a time to a ScheduleBuilder, which fills the same columns without any text.
+writeRecords writes records in the same format for both scraped legs and schedules (writeScheduleData), with
+clockTime as the inverse of parseTime. A flight of a schedule without aircraft types (e.g. built from a CSV
+schedule) is written with its seats as the aircraft type, such as "375 seats", which seatCapacity reads back.
+"""
+
+
+from array import array
+import re
+
+from .schedule import Schedule
+
+
+#seats per aircraft type, matched exactly, then without a parenthesized variant, then by longest prefix
+SEAT_CAPACITY = {
+    "Airbus A319": 160,
+    "Airbus A320": 160,
+    "Airbus A321": 240,
+    "Airbus A330": 295,
+    "Boeing 717": 134,
+    "Boeing 737": 215,
+    "Boeing 757": 295,
+    "Boeing 767": 375,
+    "Boeing 777": 400,
+    "Embraer RJ-170": 100,
+    "Embraer RJ-175": 100,
+}
+
+TIME = re.compile(r"^\s*(\d{1,2}):(\d{2})\s*([AaPp])\.?[Mm]\.?\s*(?:\+(\d+))?\s*$")
+
+#aircraft type written for a flight without one, e.g. '375 seats'
+SEATS = re.compile(r"^(\d+) seats$")
+
+
+def parseTime(text):
+    """Minutes since midnight of a time such as ' 3:20 PM' or '12:15 AM+1'"""
+    match = TIME.match(text)
+    if match is None:
+        raise ValueError("invalid flight time %r" % (text,))
+    hour, minute, half, days = match.groups()
+    minutes = int(hour) % 12 * 60 + int(minute)
+    if half in "Pp":
+        minutes += 720
+    return minutes + 1440 * int(days or 0)
+
+
+def clockTime(minutes):
+    """Scraper time text for minutes since midnight (e.g. '3:20 PM', '12:15 AM+1')"""
+    days, minutes = divmod(int(minutes), 1440)
+    hour, minute = divmod(minutes, 60)
+    text = "%d:%02d %s" % ((hour - 1) % 12 + 1, minute, "AM" if hour < 12 else "PM")
+    return text + ("+%d" % days if days else "")
+
+
+def parseAirport(text):
+    """Splits 'Los Angeles International Airport LAX' into its IATA code and name"""
+    name, _, code = text.strip().rpartition(" ")
+    if len(code) != 3 or not code.isalpha():
+        raise ValueError("airport %r does not end in an IATA code" % (text,))
+    return code.upper(), name
+
+
+def seatCapacity(aircraft, capacities=SEAT_CAPACITY, default=None):
+    """
+    Looks up the seats of an aircraft type such as 'Airbus A321 (Sharklets)' in the capacity table, or reads them
+    from a type such as '375 seats'
+    """
+    aircraft = " ".join(aircraft.split())
+    if aircraft in capacities:
+        return capacities[aircraft]
+    base = aircraft.split(" (")[0]
+    if base in capacities:
+        return capacities[base]
+    matches = [known for known in capacities if base.startswith(known)]
+    if matches:
+        return capacities[max(matches, key=len)]
+    seats = SEATS.match(aircraft)
+    if seats:
+        return int(seats.group(1))
+    if default is None:
+        raise KeyError("no seat capacity for aircraft type %r" % (aircraft,))
+    return default
+
+
+def iterFlightData(lines):
+    """Yields (departure, origin, arrival, destination, aircraft) for every record of FlightData.txt lines"""
+    record = []
+    for number, line in enumerate(lines, 1):
+        line = line.strip()
+        if line:
+            record.append(line)
+            continue
+        if record:
+            if len(record) != 5:
+                raise ValueError("record ending on line %d has %d fields instead of 5" % (number, len(record)))
+            yield record
+            record = []
+    if record:
+        if len(record) != 5:
+            raise ValueError("last record has %d fields instead of 5" % (len(record),))
+        yield record
+
+
+class ScheduleBuilder:
+    """
+    Schedule columns filled one leg at a time, interning airport codes and aircraft types as they first appear
+
+    Memory grows with the typed columns only, so legs can be added as they are scraped and the schedule taken at any
+    point with schedule().
+    """
+
+    def __init__(self, capacities=SEAT_CAPACITY, default=None):
+        self.capacities = capacities
+        self.default = default
+        self.airportIndex = {}
+        self.airportNames = {}
+        self.aircraftIndex = {}
+        self.seats = []
+        self.origin, self.departure, self.destination, self.arrival, self.capacity, self.aircraft = (
+            array("i") for _ in range(6))
+
+    def __len__(self):
+        return len(self.origin)
+
+    def airport(self, code, name=None):
+        """Index of an airport code, added to the airport table if new"""
+        index = self.airportIndex.get(code)
+        if index is None:
+            index = self.airportIndex[code] = len(self.airportIndex)
+            self.airportNames[code] = name
+        return index
+
+    def aircraftType(self, aircraft):
+        """Index of an aircraft type, looking up its seats if new"""
+        index = self.aircraftIndex.get(aircraft)
+        if index is None:
+            seats = seatCapacity(aircraft, self.capacities, self.default)
+            index = self.aircraftIndex[aircraft] = len(self.aircraftIndex)
+            self.seats.append(seats)
+        return index
+
+    def append(self, origin, departure, destination, arrival, aircraft):
+        """Adds a leg given as airport and aircraft indices and times in minutes"""
+        if arrival < departure:
+            arrival += 1440
+        self.origin.append(origin)
+        self.departure.append(departure)
+        self.destination.append(destination)
+        self.arrival.append(arrival)
+        self.capacity.append(self.seats[aircraft])
+        self.aircraft.append(aircraft)
+
+    def add(self, leg):
+        """Adds a parsed leg with departure, origin, originName, arrival, destination, destinationName, aircraft"""
+        self.append(self.airport(leg.origin, leg.originName), leg.departure,
+                    self.airport(leg.destination, leg.destinationName), leg.arrival, self.aircraftType(leg.aircraft))
+
+    def extend(self, legs):
+        for leg in legs:
+            self.add(leg)
+        return self
+
+    def schedule(self):
+        return Schedule(list(self.airportIndex), self.origin, self.departure, self.destination, self.arrival,
+                        self.capacity, self.aircraft, list(self.aircraftIndex), dict(self.airportNames))
+
+
+def readFlightData(path, capacities=SEAT_CAPACITY, default=None):
+    """Parses FlightData.txt into a Schedule with times in minutes since midnight and seats from capacities"""
+    #scraped files repeat the same few hundred time, airport and aircraft strings, so each is parsed once
+    builder = ScheduleBuilder(capacities, default)
+    airportLines = {}
+    aircraftLines = {}
+    times = {}
+
+    with open(path, encoding="utf-8") as f:
+        for leaving, start, arriving, end, plane in iterFlightData(f):
+            for text in (leaving, arriving):
+                if text not in times:
+                    times[text] = parseTime(text)
+            for text in (start, end):
+                if text not in airportLines:
+                    airportLines[text] = builder.airport(*parseAirport(text))
+            if plane not in aircraftLines:
+                aircraftLines[plane] = builder.aircraftType(plane)
+            builder.append(airportLines[start], times[leaving], airportLines[end], times[arriving],
+                           aircraftLines[plane])
+
+    return builder.schedule()
+
+
+def recordLines(departure, origin, originName, arrival, destination, destinationName, aircraft):
+    """The five lines of a FlightData.txt record of a leg with times in minutes since midnight"""
+    return (clockTime(departure), "%s %s" % (originName, origin), clockTime(arrival),
+            "%s %s" % (destinationName, destination), aircraft)
+
+
+def writeRecords(records, path):
+    """Writes records given as their five lines (recordLines) in the format of FlightData.txt"""
+    with open(path, "w", encoding="utf-8") as f:
+        for record in records:
+            f.write("%s\n%s\n%s\n%s\n%s\n\n" % tuple(record))
+
+
+def scheduleLines(schedule, i):
+    """Record lines of flight i of a Schedule; a flight without an aircraft type gets its seats as the type"""
+    origin = schedule.airports[schedule.origin[i]]
+    destination = schedule.airports[schedule.destination[i]]
+    aircraft = int(schedule.aircraft[i])
+    return recordLines(schedule.departure[i], origin, schedule.airportNames.get(origin) or "Airport",
+                       schedule.arrival[i], destination, schedule.airportNames.get(destination) or "Airport",
+                       schedule.aircraftTypes[aircraft] if aircraft >= 0 else "%d seats" % schedule.capacity[i])
+
+
+def writeScheduleData(schedule, path):
+    """Writes a Schedule (or a sequence of flights in minutes) in the 5-line record format of FlightData.txt"""
+    schedule = schedule if isinstance(schedule, Schedule) else Schedule.fromFlights(schedule)
+    writeRecords((scheduleLines(schedule, i) for i in range(len(schedule))), path)
@@ -0,0 +1,114 @@
+"""
+Incremental max flow under flight cancellations and capacity changes
+
+The network is solved once with Dinic's algorithm and its residual graph is kept. A batch of capacity changes is
+then applied one arc at a time, repairing the flow only around the changed arc:
+
+A capacity increase on arc (u, v) can only add flow along augmenting paths through that arc, so the repair looks
+for a residual path from the source to u and from v to the sink and augments along it until the arc is saturated
+or one of the two searches fails, at which point a saturated cut proves the flow is maximal again.
+
+A decrease below the current flow leaves u with a surplus and v with a deficit. The surplus is first rerouted from
+u to v around the arc, and whatever cannot be rerouted is cancelled by sending it back from u to the source and
+from the sink to v, which lowers the flow value by that amount.
+
+Every search stops as soon as it reaches its target and keeps its visited nodes in a dict, so the latency of an
+update follows the part of the network around the change rather than the size of the network.
+"""
+
+
+from .maxflow import dinic
+
+
+class IncrementalMaxFlow:
+    """Max flow of a network kept up to date under batches of arc capacity changes"""
+
+    def __init__(self, network):
+        self.network = network
+        self.capacity = network.capacity.tolist()
+        self.value, self.graph = dinic(network)
+
+    def flows(self):
+        return self.graph.flows()
+
+    def update(self, deltas):
+        """
+        Applies capacity changes given as {arc: delta} (or (arc, delta) pairs) and returns the new max flow value
+
+        A cancelled flight is a delta of minus its capacity and an aircraft swap from 375 to 240 seats a delta of
+        -135. Capacities never drop below zero.
+        """
+        changes = {}
+        for arc, delta in (deltas.items() if hasattr(deltas, "items") else deltas):
+            changes[int(arc)] = changes.get(int(arc), 0) + int(delta)
+        for arc, delta in changes.items():
+            if delta < 0:
+                self.decrease(arc, -delta)
+            elif delta > 0:
+                self.increase(arc, delta)
+        return self.value
+
+    def cancel(self, arcs):
+        """Removes the given arcs (e.g. cancelled flights) and returns the new max flow value"""
+        return self.update({arc: -self.capacity[arc] for arc in arcs})
+
+    def increase(self, arc, amount):
+        graph, residual = self.graph, self.graph.residual
+        source, sink = self.network.source, self.network.sink
+        u, v = int(self.network.tail[arc]), int(self.network.head[arc])
+        self.capacity[arc] += amount
+        residual[2 * arc] += amount
+
+        while residual[2 * arc] > 0:
+            before = [] if u == source else graph.findPath(source, u)
+            if before is None:
+                return
+            after = [] if v == sink else graph.findPath(v, sink)
+            if after is None:
+                return
+            self.value += graph.push(simplePath(graph, source, before + [2 * arc] + after), residual[2 * arc])
+
+    def decrease(self, arc, amount):
+        graph, residual = self.graph, self.graph.residual
+        source, sink = self.network.source, self.network.sink
+        u, v = int(self.network.tail[arc]), int(self.network.head[arc])
+        capacity = max(0, self.capacity[arc] - amount)
+        self.capacity[arc] = capacity
+        flow = residual[2 * arc + 1]
+        if flow <= capacity:
+            residual[2 * arc] = capacity - flow
+            return
+
+        #cut the flow on the arc down to its new capacity, leaving a surplus at u and a deficit at v
+        excess = flow - capacity
+        residual[2 * arc] = 0
+        residual[2 * arc + 1] = capacity
+
+        #reroute around the arc, then cancel the rest back to the source and from the sink
+        excess -= graph.route(u, v, excess)
+        if excess:
+            if u != source:
+                graph.route(u, source, excess)
+            if v != sink:
+                graph.route(sink, v, excess)
+            self.value -= excess
+
+
+def simplePath(graph, origin, walk):
+    """Removes the cycles of a residual walk starting at origin so that every node is visited once"""
+    nodes = [origin]
+    position = {origin: 0}
+    path = []
+    for e in walk:
+        v = graph.head[e]
+        if v in position:
+            k = position[v]
+            for node in nodes[k + 1:]:
+                del position[node]
+            del nodes[k + 1:]
+            del path[k:]
+        else:
+            position[v] = len(nodes)
+            nodes.append(v)
+            path.append(e)
+    return path
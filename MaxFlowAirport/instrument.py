@@ -0,0 +1,120 @@
+"""
+Opt-in phase timing and model size counters for max flow solves
+
+An Instrument passed to solve (or buildProblem / solveModel) records the wall clock time and Python memory of every
+phase it goes through: creating the edge variables, the objective and the conservation constraints, writing the
+model file, running CBC and reading its solution back, or building and solving the residual graph of the dinic
+backend. Memory is measured with tracemalloc as the peak allocated above the start of the phase and the part still
+held at its end; CBC runs in a separate process, so its own memory is not included. Tracing memory slows down
+allocation heavy phases several times over, Instrument(memory=False) records the times alone. Counters hold the
+network and model sizes (nodes, arcs, variables, constraints, nonzeros). Without an instrument the solve paths only
+test for None, so the overhead when disabled is a few attribute lookups per solve.
+
+    instrument = Instrument()
+    result = solve(network, instrument=instrument)
+    print(instrument.summary())
+"""
+
+
+from contextlib import contextmanager, nullcontext
+import time
+import tracemalloc
+import numpy as np
+
+
+class Instrument:
+    """Wall time, memory and call count of named phases plus free-form counters"""
+
+    def __init__(self, memory=True):
+        self.memory = memory
+        self.phases = {}
+        self.counters = {}
+        self._stack = []
+        self._tracing = False
+
+    def count(self, **counters):
+        """Sets counters, e.g. count(nodes=108, arcs=151)"""
+        self.counters.update(counters)
+
+    @contextmanager
+    def phase(self, name):
+        """
+        Times the enclosed block as the named phase; repeated phases accumulate
+
+        Phases can be nested, the time and peak memory of an inner phase are also part of the outer one.
+        """
+        start = 0
+        if self.memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._tracing = True
+            start, peak = tracemalloc.get_traced_memory()
+            if self._stack:
+                self._stack[-1][1] = max(self._stack[-1][1], peak)
+            tracemalloc.reset_peak()
+        entry = [start, start]
+        self._stack.append(entry)
+        began = time.perf_counter()
+        try:
+            yield self
+        finally:
+            seconds = time.perf_counter() - began
+            self._stack.pop()
+            peak = retained = 0
+            if self.memory:
+                current, peak = tracemalloc.get_traced_memory()
+                peak = max(peak, entry[1])
+                if self._stack:
+                    self._stack[-1][1] = max(self._stack[-1][1], peak)
+                elif self._tracing:
+                    tracemalloc.stop()
+                    self._tracing = False
+                peak, retained = peak - start, current - start
+
+            record = self.phases.setdefault(name, dict(seconds=0.0, peak=0, retained=0, calls=0))
+            record["seconds"] += seconds
+            record["peak"] = max(record["peak"], peak)
+            record["retained"] += retained
+            record["calls"] += 1
+
+    def asDict(self):
+        return dict(phases={name: dict(record) for name, record in self.phases.items()}, counters=dict(self.counters))
+
+    def summary(self):
+        """One line with the counters and the time (and peak memory) of every phase in the order they ran"""
+        parts = ["%s %s" % (name, value) for name, value in self.counters.items()]
+        for name, record in self.phases.items():
+            text = "%s %.3fs" % (name, record["seconds"])
+            if self.memory:
+                text += " %.1fMB" % (record["peak"] / 1e6)
+            parts.append(text)
+        return ", ".join(parts)
+
+
+def phase(instrument, name):
+    """The instrument's phase context, or a context that does nothing when instrument is None"""
+    return instrument.phase(name) if instrument is not None else nullcontext()
+
+
+def modelSize(network):
+    """
+    Sizes of the linear program of a network: one variable per arc, one conservation constraint for every node
+    other than the source and sink that has arcs, and one nonzero per arc end at such a node
+    """
+    degree = np.bincount(network.tail, minlength=network.numNodes) + \
+        np.bincount(network.head, minlength=network.numNodes)
+    degree[[network.source, network.sink]] = 0
+    return dict(nodes=network.numNodes, arcs=network.numArcs, variables=network.numArcs,
+                constraints=int(np.count_nonzero(degree)), nonzeros=int(degree.sum()))
+
+
+def timedMethod(instrument, name, owner, method):
+    """Replaces a method on one object by a version timed as the named phase; returns a function that restores it"""
+    original = getattr(owner, method)
+
+    def timed(*args, **kwargs):
+        with instrument.phase(name):
+            return original(*args, **kwargs)
+
+    setattr(owner, method, timed)
+    return lambda: delattr(owner, method)
@@ -0,0 +1,77 @@
+"""
+Passenger itineraries of a max flow
+
+The optimal flow only says how many passengers use each arc. Decomposing it into paths turns it into itineraries:
+every source to sink path with the number of passengers that take it, as the flights they board and the time they
+wait between two of them. Waiting arcs are never listed: a chain of them between an arrival and the next departure
+from the same airport is one layover (e.g. "215 via LAX7->CLT15, CLT16->JFK18 (CLT 1)").
+
+Every arc of a time-expanded network moves forward in time, so the flow has no cycles and each walk from the source
+along arcs that still carry flow ends at the sink. Every walk removes its bottleneck passengers from the arcs it
+used, so it empties at least one arc, and each node keeps a pointer to its first outgoing arc that still carries
+flow, so exhausted arcs are skipped once overall. The decomposition takes time linear in the number of arcs plus the
+length of the paths found, and the itineraries are yielded one at a time, so they can be written out or filtered
+without ever holding all of them in memory.
+"""
+
+
+from collections import namedtuple
+
+from .maxflow import ResidualGraph
+
+
+Itinerary = namedtuple("Itinerary", ["passengers", "legs", "flights", "layovers"])
+
+
+def itineraries(network, flows=None, graph=None, source=None, sink=None):
+    """
+    Yields the itineraries of a max flow (flows in arc order or the residual graph of a Dinic solve) from source to
+    sink (the network's own by default), in no particular order
+
+    Each Itinerary has the number of passengers, the flight arcs taken (legs), their schedule rows (flights) and the
+    (airport, time waited) layover between every two consecutive legs, in hours or minutes like the network.
+    """
+    if graph is not None:
+        flows = graph.flows()
+    elif flows is None:
+        graph = ResidualGraph(network)
+        graph.maxFlow(network.source, network.sink)
+        flows = graph.flows()
+    remaining = [int(round(flow or 0)) for flow in flows]
+    source = network.source if source is None else source
+    sink = network.sink if sink is None else sink
+    outStart, outArcs = network.outStart.tolist(), network.outArcs.tolist()
+    heads, flight, nodeTime = network.head.tolist(), network.flight.tolist(), network.nodeTime.tolist()
+    nextArc = outStart[:-1]
+
+    while True:
+        #walk from the source along arcs still carrying flow, skipping the emptied ones for good
+        node, path, passengers = source, [], None
+        while node != sink:
+            position, end = nextArc[node], outStart[node + 1]
+            while position < end and remaining[outArcs[position]] <= 0:
+                position += 1
+            nextArc[node] = position
+            if position == end:
+                if node == source:
+                    return
+                raise ValueError("flow is not conserved at node %s" % network.nodeName(node))
+            arc = outArcs[position]
+            path.append(arc)
+            passengers = remaining[arc] if passengers is None else min(passengers, remaining[arc])
+            node = heads[arc]
+        for arc in path:
+            remaining[arc] -= passengers
+
+        legs = [arc for arc in path if flight[arc] >= 0]
+        layovers = [(network.airports[network.nodeAirport[network.tail[after]]],
+                     nodeTime[network.tail[after]] - nodeTime[heads[before]]) for before, after in zip(legs, legs[1:])]
+        yield Itinerary(passengers, legs, [flight[arc] for arc in legs], layovers)
+
+
+def describeItinerary(network, itinerary):
+    """One line summary of an itinerary, e.g. 215 via LAX7->CLT15, CLT16->JFK18 (CLT 1)"""
+    legs = ", ".join("%s->%s" % (network.nodeName(network.tail[arc]), network.nodeName(network.head[arc]))
+                     for arc in itinerary.legs)
+    layovers = ", ".join("%s %s" % (airport, network.timeName(wait)) for airport, wait in itinerary.layovers)
+    return "%d via %s%s" % (itinerary.passengers, legs, " (%s)" % layovers if layovers else "")
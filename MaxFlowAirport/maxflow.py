@@ -0,0 +1,215 @@
+"""
+Combinatorial max flow engine for the time-expanded airport network
+
+Instead of writing a linear program and handing it to CBC, the network is copied into an array-backed residual
+graph and solved in process with Dinic's algorithm. Residual arc 2i is the forward copy of network arc i and
+residual arc 2i + 1 is its reverse, so the flow on arc i is the residual capacity left on its reverse arc. Each
+phase labels the nodes by their distance from the source and then pushes a blocking flow along shortest augmenting
+paths with a depth first search that never revisits an exhausted arc.
+
+Distances count only the reverse arcs of a path (cancelled flow) and the forward arcs that do not move forward in
+time: every flight and waiting arc of a time-expanded network goes forward in time, so those forward arcs cost
+nothing and still form an acyclic level graph. A plain hop count would make every waiting arc of a long chain a
+level of its own and split the solve into one phase per distinct path length.
+"""
+
+
+from collections import deque
+import numpy as np
+
+from .network import adjacency
+
+
+class ResidualGraph:
+    """Residual graph of a network held in flat lists (head, residual capacity, CSR adjacency by tail)"""
+
+    def __init__(self, network):
+        numArcs = network.numArcs
+        tail = np.empty(2 * numArcs, dtype=np.int64)
+        head = np.empty(2 * numArcs, dtype=np.int64)
+        residual = np.zeros(2 * numArcs, dtype=np.int64)
+        tail[0::2], tail[1::2] = network.tail, network.head
+        head[0::2], head[1::2] = network.head, network.tail
+        residual[0::2] = network.capacity
+        cost = np.ones(2 * numArcs, dtype=np.int64)
+        cost[0::2] = network.nodeTime[network.head] <= network.nodeTime[network.tail]
+        start, arcs = adjacency(tail, network.numNodes)
+
+        self.numNodes = network.numNodes
+        self.head = head.tolist()
+        self.cost = cost.tolist()
+        self.initial = residual.tolist()
+        self.residual = self.initial[:]
+        self.start = start.tolist()
+        self.arcs = arcs.tolist()
+
+    def reset(self):
+        """Drops the current flow so the graph can be solved again for another source and sink"""
+        self.residual = self.initial[:]
+
+    def setFlows(self, flows):
+        """Loads an arc flow vector from any backend (rounded to whole passengers) into the residual capacities"""
+        residual = self.initial[:]
+        for arc, flow in enumerate(flows):
+            flow = int(round(flow or 0))
+            residual[2 * arc] -= flow
+            residual[2 * arc + 1] = flow
+        self.residual = residual
+
+    def reachable(self, source):
+        """Nodes reachable from the source in the residual graph, as a boolean list"""
+        head, residual, start, arcs = self.head, self.residual, self.start, self.arcs
+        seen = [False] * self.numNodes
+        seen[source] = True
+        stack = [source]
+        while stack:
+            u = stack.pop()
+            for i in range(start[u], start[u + 1]):
+                e = arcs[i]
+                if residual[e] > 0 and not seen[head[e]]:
+                    seen[head[e]] = True
+                    stack.append(head[e])
+        return seen
+
+    def flows(self):
+        """Flow on every network arc, in network arc order"""
+        return self.residual[1::2]
+
+    def levels(self, source, sink):
+        """
+        Distance of every node from the source in the residual graph (-1 if unreachable)
+
+        A 0-1 breadth first search: free arcs go to the front of the queue. Labels beyond the sink's distance are
+        left unfinished as they can never lie on a shortest augmenting path.
+        """
+        head, residual, cost, start, arcs = self.head, self.residual, self.cost, self.start, self.arcs
+        level = [-1] * self.numNodes
+        done = bytearray(self.numNodes)
+        level[source] = 0
+        queue = deque([source])
+        while queue:
+            u = queue.popleft()
+            if done[u]:
+                continue
+            done[u] = 1
+            depth = level[u]
+            if done[sink] and depth > level[sink]:
+                break
+            for i in range(start[u], start[u + 1]):
+                e = arcs[i]
+                if residual[e] > 0:
+                    v = head[e]
+                    if cost[e]:
+                        if level[v] < 0 or depth + 1 < level[v]:
+                            level[v] = depth + 1
+                            queue.append(v)
+                    elif level[v] < 0 or depth < level[v]:
+                        level[v] = depth
+                        queue.appendleft(v)
+        return level
+
+    def blockingFlow(self, source, sink, level):
+        """Saturates every shortest augmenting path of the level graph and returns the flow pushed"""
+        head, residual, cost, start, arcs = self.head, self.residual, self.cost, self.start, self.arcs
+        current = start[:-1]
+        total = 0
+        path = []
+        u = source
+        while True:
+            if u == sink:
+                #augment along the path and retreat to the tail of its first saturated arc
+                pushed = min(residual[e] for e in path)
+                total += pushed
+                cut = len(path)
+                for k, e in enumerate(path):
+                    residual[e] -= pushed
+                    residual[e ^ 1] += pushed
+                    if residual[e] == 0 and k < cut:
+                        cut = k
+                del path[cut:]
+                u = head[path[-1]] if path else source
+                continue
+
+            #advance along the first admissible arc left at u
+            i, end = current[u], start[u + 1]
+            depth = level[u]
+            while i < end:
+                e = arcs[i]
+                if residual[e] > 0 and level[head[e]] == depth + cost[e]:
+                    break
+                i += 1
+            current[u] = i
+            if i < end:
+                path.append(arcs[i])
+                u = head[arcs[i]]
+                continue
+
+            #dead end, remove u from the level graph and retreat
+            level[u] = -1
+            if not path:
+                return total
+            e = path.pop()
+            u = head[e ^ 1]
+            current[u] += 1
+
+    def findPath(self, origin, target):
+        """
+        Shortest residual path from origin to target as a list of residual arcs, or None
+
+        Visited nodes are kept in a dict rather than a per-node array, so the cost is proportional to the part of
+        the graph explored before the target is reached and not to the size of the graph.
+        """
+        head, residual, start, arcs = self.head, self.residual, self.start, self.arcs
+        parent = {origin: -1}
+        queue = deque([origin])
+        while queue:
+            u = queue.popleft()
+            for i in range(start[u], start[u + 1]):
+                e = arcs[i]
+                v = head[e]
+                if residual[e] > 0 and v not in parent:
+                    parent[v] = e
+                    if v == target:
+                        path = []
+                        while v != origin:
+                            e = parent[v]
+                            path.append(e)
+                            v = head[e ^ 1]
+                        path.reverse()
+                        return path
+                    queue.append(v)
+        return None
+
+    def push(self, path, amount):
+        """Pushes up to amount along a residual path and returns the amount pushed"""
+        residual = self.residual
+        amount = min([amount] + [residual[e] for e in path])
+        for e in path:
+            residual[e] -= amount
+            residual[e ^ 1] += amount
+        return amount
+
+    def route(self, origin, target, amount):
+        """Pushes up to amount from origin to target along residual paths and returns the amount routed"""
+        routed = 0
+        while routed < amount:
+            path = self.findPath(origin, target)
+            if path is None:
+                break
+            routed += self.push(path, amount - routed)
+        return routed
+
+    def maxFlow(self, source, sink):
+        """Runs Dinic's algorithm from the current residual state and returns the additional flow pushed"""
+        total = 0
+        while True:
+            level = self.levels(source, sink)
+            if level[sink] < 0:
+                return total
+            total += self.blockingFlow(source, sink, level)
+
+
+def dinic(network):
+    """Returns the max flow value of the network and the residual graph holding the optimal flow"""
+    graph = ResidualGraph(network)
+    return graph.maxFlow(network.source, network.sink), graph
@@ -0,0 +1,150 @@
+"""
+Multi-commodity passenger flow over shared seat capacity
+
+Every origin-destination demand is a commodity with its own flow through one event network of the whole schedule,
+and all commodities compete for the same seats: the total flow of all commodities on an arc is bounded by its
+capacity. The linear program maximizes the (weighted) demand served:
+
+    max sum_k w_k s_k   subject to   flow conservation of every commodity k, with s_k leaving its source node and
+                                     reaching its sink node, 0 <= s_k <= demand_k and
+                                     sum_k x_k,a <= capacity_a for every arc a
+
+It is built directly as sparse matrices in a few vectorized passes, without an expression object per term, and
+solved in process by the HiGHS solver bundled with SciPy. Demands leaving the same source node share one flow, with
+each demand served where it reaches its own sink: passengers of one origin are interchangeable until they arrive,
+and any such flow splits into paths to every sink, so this is exact and hundreds of origin-destination pairs
+between a few dozen origins cost a few dozen flows. A flow only gets variables on the arcs that lie on some path
+from its source to one of its sinks (one graph search each way), and only arcs used by two or more flows get a
+joint capacity row; every other capacity is a variable bound.
+SciPy is imported on the first solve, so the rest of the package works without it.
+"""
+
+
+from collections import namedtuple
+import numpy as np
+
+from .instrument import phase
+
+
+Demand = namedtuple("Demand", ["source", "sink", "demand", "weight", "window"], defaults=(1, None))
+MultiCommodityResult = namedtuple("MultiCommodityResult", ["value", "demands", "served", "origins", "flows"])
+
+
+def demandMatrix(airports, matrix, weights=None):
+    """Demands of the nonzero entries of a square matrix (row = source, column = sink) over a list of airports"""
+    matrix = np.asarray(matrix)
+    weights = np.ones_like(matrix, dtype=np.float64) if weights is None else np.asarray(weights)
+    return [Demand(airports[i], airports[j], matrix[i, j].item(), weights[i, j].item())
+            for i, j in zip(*np.nonzero(matrix)) if i != j]
+
+
+def normalizeDemands(demands):
+    """Demands from a {(source, sink): demand} mapping or (source, sink, demand[, weight[, window]]) tuples"""
+    if hasattr(demands, "items"):
+        demands = [(source, sink, demand) for (source, sink), demand in demands.items()]
+    return [Demand(*demand) for demand in demands]
+
+
+def reachableNodes(graph, node):
+    """Boolean mask of the nodes a breadth first search of a sparse graph reaches from node"""
+    from scipy.sparse.csgraph import breadth_first_order
+
+    seen = np.zeros(graph.shape[0], dtype=bool)
+    seen[breadth_first_order(graph, node, return_predecessors=False)] = True
+    return seen
+
+
+def buildCommodityModel(network, demands):
+    """
+    Sparse linear program of the demands on a network: (c, A_ub, b_ub, A_eq, b_eq, bounds) in linprog form, the
+    source node of every flow, and the flow and arc of every flow variable; the served demands are the last variables
+    """
+    from scipy.sparse import csr_matrix
+
+    numNodes = network.numNodes
+    horizon = (int(network.nodeTime.min()), int(network.nodeTime.max())) if numNodes else (0, 0)
+    usable = network.capacity > 0
+    graph = csr_matrix((np.ones(int(usable.sum())), (network.tail[usable], network.head[usable])),
+                       shape=(numNodes, numNodes))
+    reverse = graph.T.tocsr()
+
+    #one flow per source node, with variables on the arcs between it and the sinks of its demands
+    ends = []
+    for demand in demands:
+        window = demand.window or horizon
+        source = network.firstNode(demand.source, window[0])
+        sink = network.lastNode(demand.sink, window[1])
+        ends.append((source, sink) if source >= 0 and sink >= 0 and demand.source != demand.sink else (-1, -1))
+    sources = np.array([source for source, sink in ends], dtype=np.int64)
+    sinks = np.array([sink for source, sink in ends], dtype=np.int64)
+    valid = np.flatnonzero(sources >= 0)
+    origins, group = np.unique(sources[valid], return_inverse=True)
+    backward = {}
+    arcs = []
+    for index, origin in enumerate(origins.tolist()):
+        reaching = np.zeros(numNodes, dtype=bool)
+        for sink in np.unique(sinks[valid[group == index]]).tolist():
+            if sink not in backward:
+                backward[sink] = reachableNodes(reverse, sink)
+            reaching |= backward[sink]
+        onPath = reachableNodes(graph, origin) & reaching
+        arcs.append(np.flatnonzero(usable & onPath[network.tail] & onPath[network.head]))
+    flow = np.repeat(np.arange(len(origins), dtype=np.int64), [len(chosen) for chosen in arcs])
+    arc = np.concatenate(arcs) if arcs else np.empty(0, dtype=np.int64)
+    numFlows = len(arc)
+    numVariables = numFlows + len(demands)
+
+    #conservation: inflow - outflow of every (flow, node), plus every demand served at its source and minus it at
+    #its sink, is zero; rows are only made for the (flow, node) pairs that occur
+    rowKeys = np.concatenate([flow * numNodes + network.head[arc], flow * numNodes + network.tail[arc],
+                              group * numNodes + sources[valid], group * numNodes + sinks[valid]])
+    columns = np.concatenate([np.arange(numFlows), np.arange(numFlows), numFlows + valid, numFlows + valid])
+    values = np.concatenate([np.ones(numFlows), -np.ones(numFlows), np.ones(len(valid)), -np.ones(len(valid))])
+    keys, rows = np.unique(rowKeys, return_inverse=True)
+    equality = csr_matrix((values, (rows, columns)), shape=(len(keys), numVariables))
+
+    #joint seat capacity of the arcs shared by several flows, the others are bounded by their variable alone
+    shared, position, uses = np.unique(arc, return_inverse=True, return_counts=True)
+    jointRow = np.cumsum(uses > 1) - 1
+    joint = uses[position] > 1
+    capacityRows = csr_matrix((np.ones(int(joint.sum())), (jointRow[position[joint]], np.flatnonzero(joint))),
+                              shape=(int((uses > 1).sum()), numVariables))
+
+    weights = np.array([demand.weight for demand in demands], dtype=np.float64)
+    cost = np.concatenate([np.zeros(numFlows), -weights])
+    upper = np.concatenate([network.capacity[arc].astype(np.float64),
+                            np.where(sources >= 0, [float(demand.demand) for demand in demands], 0.0)])
+    bounds = np.column_stack([np.zeros(numVariables), upper])
+    return (cost, capacityRows, network.capacity[shared[uses > 1]].astype(np.float64), equality,
+            np.zeros(len(keys)), bounds), origins, flow, arc
+
+
+def multiCommodityFlow(network, demands, method="highs-ipm", instrument=None):
+    """
+    Maximizes the total weighted demand served between many origin-destination pairs sharing the seats of a network
+
+    network should be an event network of the whole schedule (buildEventNetwork or loadNetwork(events=True)) and
+    demands a {(source, sink): demand} mapping, (source, sink, demand[, weight[, window]]) tuples or Demand records;
+    a demand without a window uses the whole horizon. Returns a MultiCommodityResult with the weighted value, the
+    served demand of every commodity, the source nodes of the flows and their flow on every arc as a sparse source x
+    arc matrix. method is the linprog method, the HiGHS interior point solver by default, which is several times
+    faster than its simplex solvers on these models.
+    """
+    from scipy.optimize import linprog
+    from scipy.sparse import csr_matrix
+
+    demands = normalizeDemands(demands)
+    with phase(instrument, "model"):
+        (cost, upperRows, upper, equality, rhs, bounds), origins, flow, arc = buildCommodityModel(network, demands)
+    if instrument is not None:
+        instrument.count(commodities=len(demands), sources=len(origins), variables=len(cost),
+                         constraints=upperRows.shape[0] + equality.shape[0], nonzeros=upperRows.nnz + equality.nnz)
+    with phase(instrument, "solve"):
+        result = linprog(cost, A_ub=upperRows if upperRows.shape[0] else None, b_ub=upper if len(upper) else None,
+                         A_eq=equality, b_eq=rhs, bounds=bounds, method=method)
+    if result.status != 0:
+        raise RuntimeError("multi-commodity LP not solved: %s" % result.message)
+    with phase(instrument, "extract"):
+        numFlows = len(arc)
+        flows = csr_matrix((result.x[:numFlows], (flow, arc)), shape=(len(origins), network.numArcs))
+        return MultiCommodityResult(-result.fun, demands, result.x[numFlows:], origins.tolist(), flows)
@@ -0,0 +1,307 @@
+"""
+Time-expanded network builder for the airport max flow problem
+
+Every airport is expanded into one node per hour of the horizon (e.g. LAX10 = 10 AM in the LAX airport). Ground
+arcs carry passengers waiting in an airport from one hour to the next (e.g. SFO7,8) and flight arcs carry passengers
+between airports (e.g. LAX7,JFK15). Flow enters at the first hour of the source airport and leaves at the last hour
+of the sink airport. The network is stored as flat arc arrays with CSR adjacency so that schedules with thousands
+of airports and hundreds of thousands of flights are built in a few vectorized passes.
+
+buildEventNetwork builds the same model at minute resolution with nodes only at the departure and arrival events
+of each airport (e.g. LAX15:20), chained by waiting arcs. It drops the pass-through hours where nothing happens
+(e.g. SFO between 1 and 8 AM) and connects flights by their exact times instead of the hour they fall in.
+
+Every array of a network is int32 whenever its values fit (node and arc ids, seats, minutes and schedule rows
+always do below two billion arcs), with the airport codes interned in one table, so an arc costs 24 bytes: tail,
+head, capacity, flight and its place in the outgoing and incoming adjacency; a node costs 16 bytes. Ten million
+arcs with their nodes fit in about 280 MB and a network reports its own size (nbytes, bytesPerArc); a Dinic solve
+still works on Python lists made from the arrays (ResidualGraph). Arc and Node are small views with __slots__ made
+on demand, not one object per arc.
+"""
+
+
+import numpy as np
+
+from .schedule import Schedule
+
+
+INT32 = np.iinfo(np.int32)
+
+
+def compact(values):
+    """Integer array as int32 when its values fit, else int64; int32 arrays (e.g. memory-mapped) are not copied"""
+    values = np.asarray(values)
+    if values.dtype == np.int32:
+        return values
+    if len(values) and (values.min() < INT32.min or values.max() > INT32.max):
+        return values.astype(np.int64, copy=False)
+    return values.astype(np.int32)
+
+
+class FlightNetwork:
+    """Time-expanded network stored as compact arc arrays (tail, head, capacity, flight) with CSR in/out adjacency"""
+
+    def __init__(self, airports, nodeAirport, nodeTime, tail, head, capacity, flight, flights, source, sink,
+                 outStart=None, outArcs=None, inStart=None, inArcs=None, clock=False):
+        self.airports = airports
+        self.airportIndex = {code: i for i, code in enumerate(airports)}
+        self.nodeAirport = compact(nodeAirport)
+        self.nodeTime = compact(nodeTime)
+        self.tail = compact(tail)
+        self.head = compact(head)
+        self.capacity = compact(capacity)
+        self.flight = compact(flight)
+        self.flights = flights
+        self.source = source
+        self.sink = sink
+        self.clock = clock
+        #adjacency is only rebuilt when it is not handed over, e.g. from a memory-mapped cache entry
+        if outStart is None:
+            outStart, outArcs = adjacency(self.tail, len(self.nodeAirport))
+            inStart, inArcs = adjacency(self.head, len(self.nodeAirport))
+        self.outStart, self.outArcs = compact(outStart), compact(outArcs)
+        self.inStart, self.inArcs = compact(inStart), compact(inArcs)
+
+    @property
+    def numNodes(self):
+        return len(self.nodeAirport)
+
+    @property
+    def numArcs(self):
+        return len(self.tail)
+
+    @property
+    def nbytes(self):
+        """Bytes held by the node, arc and adjacency arrays"""
+        return sum(getattr(self, name).nbytes for name in ("nodeAirport", "nodeTime", "tail", "head", "capacity",
+                                                          "flight", "outStart", "outArcs", "inStart", "inArcs"))
+
+    @property
+    def bytesPerArc(self):
+        return self.nbytes / max(self.numArcs, 1)
+
+    @property
+    def groundCapacity(self):
+        """Capacity of the waiting arcs (the largest one), or None for a network without any"""
+        ground = self.capacity[self.flight < 0]
+        return int(ground.max()) if len(ground) else None
+
+    def arc(self, arc):
+        return Arc(self, arc)
+
+    def node(self, node):
+        return Node(self, node)
+
+    def outgoing(self, node):
+        return self.outArcs[self.outStart[node]:self.outStart[node + 1]]
+
+    def incoming(self, node):
+        return self.inArcs[self.inStart[node]:self.inStart[node + 1]]
+
+    def isFlight(self, arc):
+        return self.flight[arc] >= 0
+
+    def firstNode(self, airport, time):
+        """First node of an airport code at or after time, or -1 (nodes are numbered by airport, then time)"""
+        low, high = self.airportNodes(airport)
+        node = low + int(np.searchsorted(self.nodeTime[low:high], time, side="left"))
+        return node if node < high else -1
+
+    def lastNode(self, airport, time):
+        """Last node of an airport code at or before time, or -1"""
+        low, high = self.airportNodes(airport)
+        node = low + int(np.searchsorted(self.nodeTime[low:high], time, side="right")) - 1
+        return node if node >= low else -1
+
+    def airportNodes(self, airport):
+        """Range of node ids of an airport code (empty for unknown airports)"""
+        if airport not in self.airportIndex:
+            return 0, 0
+        index = self.airportIndex[airport]
+        return (int(np.searchsorted(self.nodeAirport, index, side="left")),
+                int(np.searchsorted(self.nodeAirport, index, side="right")))
+
+    def findArcs(self, name):
+        """Arcs named like arcName (e.g. ATL21,JFK23), several when flights share origin, destination and times"""
+        if getattr(self, "arcNames", None) is None:
+            self.arcNames = {}
+            for arc in range(self.numArcs):
+                self.arcNames.setdefault(self.arcName(arc), []).append(arc)
+        return self.arcNames.get(name, [])
+
+    def timeName(self, time):
+        """Hour of an hourly network (e.g. 10) or clock time of a minute network (e.g. 15:20, 25:05 the next day)"""
+        if self.clock:
+            return "%d:%02d" % divmod(int(time), 60)
+        return str(time)
+
+    def nodeName(self, node):
+        """Airport code followed by the time of the node (e.g. LAX10 or LAX15:20)"""
+        return self.airports[self.nodeAirport[node]] + self.timeName(self.nodeTime[node])
+
+    def arcName(self, arc):
+        """Ground arcs are named LAX1,2 and flight arcs LAX7,JFK15"""
+        tail, head = self.tail[arc], self.head[arc]
+        if self.flight[arc] < 0:
+            return self.nodeName(tail) + "," + self.timeName(self.nodeTime[head])
+        return self.nodeName(tail) + "," + self.nodeName(head)
+
+
+class Arc:
+    """View of one arc of a network"""
+
+    __slots__ = ("network", "index")
+
+    def __init__(self, network, index):
+        self.network = network
+        self.index = int(index)
+
+    @property
+    def tail(self):
+        return Node(self.network, self.network.tail[self.index])
+
+    @property
+    def head(self):
+        return Node(self.network, self.network.head[self.index])
+
+    @property
+    def capacity(self):
+        return int(self.network.capacity[self.index])
+
+    @property
+    def flight(self):
+        """Schedule row of a flight arc, -1 for a ground arc"""
+        return int(self.network.flight[self.index])
+
+    @property
+    def name(self):
+        return self.network.arcName(self.index)
+
+    def __repr__(self):
+        return "Arc(%d, %s, capacity=%d)" % (self.index, self.name, self.capacity)
+
+
+class Node:
+    """View of one node (airport and time) of a network"""
+
+    __slots__ = ("network", "index")
+
+    def __init__(self, network, index):
+        self.network = network
+        self.index = int(index)
+
+    @property
+    def airport(self):
+        return self.network.airports[self.network.nodeAirport[self.index]]
+
+    @property
+    def time(self):
+        return int(self.network.nodeTime[self.index])
+
+    @property
+    def name(self):
+        return self.network.nodeName(self.index)
+
+    def outgoing(self):
+        return [Arc(self.network, arc) for arc in self.network.outgoing(self.index)]
+
+    def incoming(self):
+        return [Arc(self.network, arc) for arc in self.network.incoming(self.index)]
+
+    def __repr__(self):
+        return "Node(%d, %s)" % (self.index, self.name)
+
+
+def adjacency(ends, numNodes):
+    """Returns CSR (start, arcs) arrays grouping arc ids by the given endpoint array"""
+    arcs = np.argsort(ends, kind="stable")
+    start = np.zeros(numNodes + 1, dtype=np.int64)
+    np.cumsum(np.bincount(ends, minlength=numNodes), out=start[1:])
+    return start, arcs
+
+
+def flightColumns(flights, source, sink):
+    """Network airport table (source first) and int64 flight columns indexing into it"""
+    schedule = flights if isinstance(flights, Schedule) else Schedule.fromFlights(flights)
+    airports = list(dict.fromkeys([source] + schedule.airports + [sink]))
+    airportIndex = {code: i for i, code in enumerate(airports)}
+    remap = np.array([airportIndex[code] for code in schedule.airports], dtype=np.int64)
+    return (airports, airportIndex, remap[schedule.origin], remap[schedule.destination],
+            schedule.departure.astype(np.int64), schedule.arrival.astype(np.int64),
+            schedule.capacity.astype(np.int64))
+
+
+def buildNetwork(flights, source, sink, start=1, end=24, groundCapacity=9999, step=1):
+    """
+    Builds the hourly time-expanded network of a schedule between source and sink over the horizon start - end
+
+    flights is a Schedule or a sequence of flights. Flight times are divided by step (e.g. step=60 for a scraped
+    schedule in minutes) and rounded down to the hour. Flights that depart before the start of the horizon, arrive
+    after its end or arrive in the hour they depart are left out of the network. The flight array maps every
+    flight arc back to its position in flights (-1 for ground arcs).
+    """
+    airports, airportIndex, origin, destination, departure, arrival, seats = flightColumns(flights, source, sink)
+    slots = end - start + 1
+    departure //= step
+    arrival //= step
+    kept = np.flatnonzero((departure >= start) & (arrival <= end) & (departure < arrival))
+
+    #one node per airport and hour, numbered airport by airport
+    nodeAirport = np.repeat(np.arange(len(airports), dtype=np.int64), slots)
+    nodeTime = np.tile(np.arange(start, end + 1, dtype=np.int64), len(airports))
+
+    #ground arcs from every hour to the next within each airport
+    grid = np.arange(len(airports) * slots, dtype=np.int64).reshape(len(airports), slots)
+    groundTail = grid[:, :-1].ravel()
+    groundHead = grid[:, 1:].ravel()
+
+    #flight arcs from the departure hour of the origin to the arrival hour of the destination
+    flightTail = origin[kept] * slots + departure[kept] - start
+    flightHead = destination[kept] * slots + arrival[kept] - start
+
+    tail = np.concatenate([groundTail, flightTail])
+    head = np.concatenate([groundHead, flightHead])
+    capacity = np.concatenate([np.full(len(groundTail), groundCapacity, dtype=np.int64), seats[kept]])
+    flight = np.concatenate([np.full(len(groundTail), -1, dtype=np.int64), kept])
+
+    return FlightNetwork(airports, nodeAirport, nodeTime, tail, head, capacity, flight, flights,
+                         airportIndex[source] * slots, airportIndex[sink] * slots + slots - 1)
+
+
+def buildEventNetwork(flights, source, sink, start=0, end=1440, groundCapacity=9999):
+    """
+    Builds the event-based time-expanded network of a schedule between source and sink over the horizon start - end
+
+    Times are minutes since midnight (the next day continues from 1440). Each airport gets one node per distinct
+    departure or arrival time of a flight inside the horizon, plus the start of the horizon at the source and its
+    end at the sink, and waiting arcs join consecutive nodes of the same airport. A flight arriving at a given
+    minute connects to every flight leaving the same airport from that minute on.
+    """
+    airports, airportIndex, origin, destination, departure, arrival, seats = flightColumns(flights, source, sink)
+    span = end - start + 1
+    kept = np.flatnonzero((departure >= start) & (arrival <= end) & (departure < arrival))
+
+    #one node per distinct (airport, time) event, keyed and sorted by airport then time
+    departureKey = origin[kept] * span + departure[kept] - start
+    arrivalKey = destination[kept] * span + arrival[kept] - start
+    sourceKey = airportIndex[source] * span
+    sinkKey = airportIndex[sink] * span + span - 1
+    keys = np.unique(np.concatenate([departureKey, arrivalKey, [sourceKey, sinkKey]]))
+    nodeAirport = keys // span
+    nodeTime = keys % span + start
+
+    #waiting arcs between consecutive events of the same airport
+    groundTail = np.flatnonzero(nodeAirport[:-1] == nodeAirport[1:])
+    groundHead = groundTail + 1
+
+    #flight arcs from the departure event of the origin to the arrival event of the destination
+    flightTail = np.searchsorted(keys, departureKey)
+    flightHead = np.searchsorted(keys, arrivalKey)
+
+    tail = np.concatenate([groundTail, flightTail])
+    head = np.concatenate([groundHead, flightHead])
+    capacity = np.concatenate([np.full(len(groundTail), groundCapacity, dtype=np.int64), seats[kept]])
+    flight = np.concatenate([np.full(len(groundTail), -1, dtype=np.int64), kept])
+
+    return FlightNetwork(airports, nodeAirport, nodeTime, tail, head, capacity, flight, flights,
+                         int(np.searchsorted(keys, sourceKey)), int(np.searchsorted(keys, sinkKey)), clock=True)
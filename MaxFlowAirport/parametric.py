@@ -0,0 +1,116 @@
+"""
+Parametric max flow over a range of capacity scalings (load factor curves)
+
+When every arc capacity is an affine function of a parameter (seats times a load factor, one carrier's flights
+scaled up or down), the capacity of every cut is a line in the parameter and the max flow, the smallest of them, is
+a concave piecewise-linear curve. Its breakpoints are found exactly by intersecting the min cut lines at the two
+ends of an interval and solving once at the intersection: if the flow there lies on both lines the intersection is
+the only breakpoint of the interval, otherwise the new min cut splits it in two. The whole curve takes at most two
+solves per breakpoint plus the two at the ends of the range, however finely the range would have to be sampled.
+
+Every solve is exact: at a parameter p/q all capacities are multiplied by q so that Dinic's algorithm still runs on
+whole numbers, and the curve is made of the exact cut lines rather than sampled. Each solve starts from an empty
+flow: starting from the flow of a neighbouring parameter fills the residual graph with reverse arcs, which costs
+Dinic more phases than it saves on time-expanded networks.
+"""
+
+
+from collections import namedtuple
+from fractions import Fraction
+import numpy as np
+
+from .maxflow import ResidualGraph
+
+
+Segment = namedtuple("Segment", ["low", "high", "intercept", "slope"])
+ParametricCurve = namedtuple("ParametricCurve", ["points", "breakpoints", "segments", "solves"])
+
+
+def loadFactor(network, arcs=None):
+    """
+    Capacity scaling of a network with the seats of the given arcs (every flight by default) multiplied by the
+    parameter, e.g. arcs from network.findArcs or the flight arcs of one carrier
+    """
+    scaled = np.zeros(network.numArcs, dtype=bool)
+    scaled[network.flight >= 0 if arcs is None else np.asarray(arcs, dtype=np.int64)] = True
+    return lambda factor: np.where(scaled, network.capacity * factor, network.capacity)
+
+
+def affineCapacities(network, scale, low, high):
+    """Whole-seat intercept and slope of every arc capacity from a scaling function, checked to be affine"""
+    base, top = (np.asarray(scale(value), dtype=np.float64) for value in (0, 1))
+    intercept, slope = np.round(base), np.round(top - base)
+    if not (np.allclose(base, intercept) and np.allclose(top - base, slope)):
+        raise ValueError("the scaled capacities at 0 and 1 must be whole seats")
+    middle = (low + high) / 2
+    if not np.allclose(np.asarray(scale(middle), dtype=np.float64), intercept + slope * middle):
+        raise ValueError("the capacities must be an affine function of the parameter")
+    if (intercept + slope * low).min(initial=0) < 0 or (intercept + slope * high).min(initial=0) < 0:
+        raise ValueError("the capacities must not be negative over the parameter range")
+    return intercept.astype(np.int64), slope.astype(np.int64)
+
+
+def parametricMaxFlow(network, scale, low=0.5, high=1.0):
+    """
+    Max flow of a network as a function of a parameter between low and high, with capacities scale(parameter)
+
+    scale returns the arc capacities for a parameter value and must be affine in it (see loadFactor). Returns a
+    ParametricCurve: the (parameter, max flow) points at both ends and every breakpoint, to be interpolated linearly
+    (e.g. with np.interp), the breakpoints alone, the segments between them with the line of their min cut
+    (intercept + slope * parameter, exact in seats) and the number of max flow solves it took.
+    """
+    #floats are read by their shortest decimal form (0.1 -> 1/10, not the binary fraction with a 2**55 denominator)
+    low, high = (value if isinstance(value, Fraction) else Fraction(str(value)) for value in (low, high))
+    if high < low:
+        raise ValueError("low must not be above high")
+    intercept, slope = affineCapacities(network, scale, float(low), float(high))
+    source, sink = network.source, network.sink
+    graph = ResidualGraph(network)
+    intercepts, slopes = intercept.tolist(), slope.tolist()
+    solved = {}
+
+    def solveAt(parameter):
+        """Max flow at the parameter and the line of its min cut"""
+        if parameter not in solved:
+            unit, step = parameter.denominator, parameter.numerator
+            residual = [0] * (2 * len(intercepts))
+            residual[0::2] = [unit * a + step * b for a, b in zip(intercepts, slopes)]
+            graph.residual = residual
+            value = Fraction(graph.maxFlow(source, sink), unit)
+            cut = np.array(graph.reachable(source), dtype=bool)
+            cut = cut[network.tail] & ~cut[network.head]
+            solved[parameter] = value, (int(intercept[cut].sum()), int(slope[cut].sum()))
+        return solved[parameter]
+
+    #split every interval at the intersection of the min cut lines of its ends until the max flow there lies on them
+    segments = []
+    stack = [(low, solveAt(low)[1], high, solveAt(high)[1])]
+    while stack:
+        left, leftLine, right, rightLine = stack.pop()
+        if leftLine == rightLine or leftLine[1] == rightLine[1]:
+            segments.append(Segment(left, right, *min(leftLine, rightLine)))
+            continue
+        crossing = Fraction(rightLine[0] - leftLine[0], leftLine[1] - rightLine[1])
+        if crossing <= left or crossing >= right:
+            #one line is a min cut at both ends and, the curve being concave, all the way between them
+            segments.append(Segment(left, right, *(rightLine if crossing <= left else leftLine)))
+            continue
+        value, line = solveAt(crossing)
+        if value == leftLine[0] + leftLine[1] * crossing:
+            segments += [Segment(left, crossing, *leftLine), Segment(crossing, right, *rightLine)]
+        else:
+            stack += [(crossing, line, right, rightLine), (left, leftLine, crossing, line)]
+
+    #merge neighbouring segments on the same line
+    segments.sort()
+    merged = [segments[0]]
+    for segment in segments[1:]:
+        if segment[2:] == merged[-1][2:]:
+            merged[-1] = merged[-1]._replace(high=segment.high)
+        else:
+            merged.append(segment)
+    breakpoints = [float(segment.low) for segment in merged[1:]]
+    points = [(float(segment.low), float(segment.intercept + segment.slope * segment.low)) for segment in merged]
+    points.append((float(high), float(merged[-1].intercept + merged[-1].slope * high)))
+    segments = [Segment(float(s.low), float(s.high), s.intercept, s.slope) for s in merged]
+    return ParametricCurve(points, breakpoints, segments, len(solved))
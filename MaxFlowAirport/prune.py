@@ -0,0 +1,119 @@
+"""
+Reachability pruning and waiting chain contraction of a time-expanded network
+
+Most of a time-expanded network can never carry flow: the hours of JFK before its first arrival, the ground arcs of
+an airport before any flight from the source can reach it, and in a national schedule whole airports that cannot
+be reached from the source in time or cannot reach the sink before the end of the horizon. Every arc moves forward
+in time, so a search forward from the source and one backward from the sink over the arcs with capacity find the
+nodes that lie on some source to sink path; every other node and every arc touching one is dropped.
+
+What is left still has long chains of waiting arcs through nodes where nothing happens any more (one waiting arc
+in, one waiting arc out, e.g. SFO between 1 and 8 AM once the flights that touched it were dropped). Each chain
+becomes a single waiting arc with the smallest capacity along it (e.g. SFO1,8), so the model gets a variable per
+chain instead of per hour. The flow of a solve on the pruned network maps back to every arc of the original one.
+"""
+
+
+from collections import namedtuple
+import numpy as np
+
+from .network import FlightNetwork
+
+
+PruneReport = namedtuple("PruneReport", ["nodes", "arcs", "keptNodes", "keptArcs", "deadNodes", "deadArcs",
+                                         "contractedNodes", "contractedArcs"])
+PrunedNetwork = namedtuple("PrunedNetwork", ["network", "arcMap", "report"])
+
+
+def reachableFrom(start, ends, node):
+    """Boolean mask of the nodes reached from node along CSR adjacency (start, ends = far endpoint of every entry)"""
+    seen = [False] * (len(start) - 1)
+    seen[node] = True
+    stack = [node]
+    while stack:
+        u = stack.pop()
+        for v in ends[start[u]:start[u + 1]]:
+            if not seen[v]:
+                seen[v] = True
+                stack.append(v)
+    return np.array(seen, dtype=bool)
+
+
+def pruneNetwork(network, source=None, sink=None):
+    """
+    Drops the nodes and arcs of a network that lie on no path from source to sink (the network's own by default) and
+    contracts chains of waiting arcs through nodes with one waiting arc in and one out
+
+    Returns a PrunedNetwork: the smaller network (same airports, node order, source and sink), the arc of it that
+    carries every original arc (-1 for dropped arcs) and a PruneReport of the sizes before and after.
+    """
+    source = network.source if source is None else source
+    sink = network.sink if sink is None else sink
+    numNodes, numArcs = network.numNodes, network.numArcs
+    usable = network.capacity > 0
+
+    #nodes on some source to sink path: reached forward from the source and backward from the sink
+    outArcs = network.outArcs[usable[network.outArcs]]
+    outStart = np.concatenate([[0], np.cumsum(np.bincount(network.tail[usable], minlength=numNodes))])
+    inArcs = network.inArcs[usable[network.inArcs]]
+    inStart = np.concatenate([[0], np.cumsum(np.bincount(network.head[usable], minlength=numNodes))])
+    alive = (reachableFrom(outStart.tolist(), network.head[outArcs].tolist(), source)
+             & reachableFrom(inStart.tolist(), network.tail[inArcs].tolist(), sink))
+    alive[[source, sink]] = True
+    live = usable & alive[network.tail] & alive[network.head]
+
+    #pass-through nodes: exactly one live arc in and one out, both waiting arcs
+    liveArcs = np.flatnonzero(live)
+    inDegree = np.bincount(network.head[liveArcs], minlength=numNodes)
+    outDegree = np.bincount(network.tail[liveArcs], minlength=numNodes)
+    inArc = np.full(numNodes, -1, dtype=np.int64)
+    outArc = np.full(numNodes, -1, dtype=np.int64)
+    inArc[network.head[liveArcs]] = liveArcs
+    outArc[network.tail[liveArcs]] = liveArcs
+    passing = alive & (inDegree == 1) & (outDegree == 1)
+    passing[[source, sink]] = False
+    passing[passing] = (network.flight[inArc[passing]] < 0) & (network.flight[outArc[passing]] < 0)
+
+    #every live arc leaving a kept node starts a chain that runs on through pass-through nodes
+    arcMap = np.full(numArcs, -1, dtype=np.int64)
+    starts = liveArcs[~passing[network.tail[liveArcs]]]
+    arcMap[starts] = np.arange(len(starts))
+    passingList, outArcList = passing.tolist(), outArc.tolist()
+    headList, capacityList = network.head.tolist(), network.capacity.tolist()
+    ends, capacity, chained, chains = [], [], [], []
+    for index, arc in enumerate(starts.tolist()):
+        node, smallest = headList[arc], capacityList[arc]
+        while passingList[node]:
+            arc = outArcList[node]
+            chained.append(arc)
+            chains.append(index)
+            smallest = min(smallest, capacityList[arc])
+            node = headList[arc]
+        ends.append(node)
+        capacity.append(smallest)
+    arcMap[chained] = chains
+
+    kept = alive & ~passing
+    remap = np.cumsum(kept) - 1
+    pruned = FlightNetwork(network.airports, network.nodeAirport[kept], network.nodeTime[kept],
+                           remap[network.tail[starts]], remap[np.array(ends, dtype=np.int64)],
+                           np.array(capacity, dtype=np.int64), network.flight[starts], network.flights,
+                           int(remap[source]), int(remap[sink]), clock=network.clock)
+    report = PruneReport(numNodes, numArcs, int(kept.sum()), len(starts), int(numNodes - alive.sum()),
+                         int(numArcs - live.sum()), int(passing.sum()), int(live.sum()) - len(starts))
+    return PrunedNetwork(pruned, arcMap, report)
+
+
+def expandFlows(pruned, flows):
+    """Flow on every arc of the original network from the flows of a solve on the pruned one"""
+    flows = np.append(np.asarray(flows, dtype=np.float64), 0.0)
+    return flows[pruned.arcMap].tolist()
+
+
+def describePrune(report):
+    """Summary of a PruneReport, e.g. 1200 -> 310 nodes (-74%), 2000 -> 400 arcs (-80%), ..."""
+    shrink = lambda before, after: 100 * (1 - after / before) if before else 0
+    return ("%d -> %d nodes (-%.0f%%), %d -> %d arcs (-%.0f%%), %d dead nodes, %d dead arcs, %d waiting chain nodes "
+            "contracted" % (report.nodes, report.keptNodes, shrink(report.nodes, report.keptNodes), report.arcs,
+                            report.keptArcs, shrink(report.arcs, report.keptArcs), report.deadNodes, report.deadArcs,
+                            report.contractedNodes))
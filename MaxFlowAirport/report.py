@@ -0,0 +1,56 @@
+"""
+Minimum cut and bottleneck flight report of a solved network
+
+The nodes still reachable from the source in the residual graph of a max flow form the source side of a minimum
+cut, and the arcs leaving them are saturated and sum to the max flow value. They are the flights (and waiting arcs)
+that limit throughput: raising any other capacity cannot increase the flow. The cut is found with a single graph
+search over the residual graph, for flows from either backend, and is reported per arc along with the share of
+the bottleneck capacity departing from and arriving at every airport node (e.g. LAX7 or JFK15:20). Capacities are
+read from the residual graph (residual plus flow of every arc), so the report follows the capacity changes applied
+to the graph of an IncrementalMaxFlow rather than the capacities the network was built with.
+"""
+
+
+from collections import namedtuple
+import numpy as np
+
+from .maxflow import ResidualGraph
+
+
+CutArc = namedtuple("CutArc", ["arc", "name", "flight", "capacity", "flow"])
+CutReport = namedtuple("CutReport", ["capacity", "arcs", "departures", "arrivals"])
+
+
+def minCut(network, flows=None, graph=None):
+    """
+    Minimum cut of a network from its max flow (flows in arc order) or from the residual graph of a Dinic solve
+
+    Returns a CutReport with the cut capacity, the cut arcs from the largest capacity down (flight is the schedule
+    record of a flight arc and None for a waiting arc) and the share of the cut capacity leaving (departures) and
+    entering (arrivals) each node, keyed by node name; both are empty when the cut has no capacity.
+    """
+    if graph is None:
+        graph = ResidualGraph(network)
+        graph.setFlows(flows)
+    sourceSide = np.array(graph.reachable(network.source), dtype=bool)
+    cut = np.flatnonzero(sourceSide[network.tail] & ~sourceSide[network.head])
+    residual = graph.residual
+
+    arcs = []
+    for arc in cut.tolist():
+        row = int(network.flight[arc])
+        flow = residual[2 * arc + 1]
+        arcs.append(CutArc(arc, network.arcName(arc), network.flights[row] if row >= 0 else None,
+                           residual[2 * arc] + flow, flow))
+    arcs.sort(key=lambda cutArc: (-cutArc.capacity, cutArc.arc))
+    total = sum(cutArc.capacity for cutArc in arcs)
+
+    #a cut without capacity (e.g. only empty flights leave the source) has no shares to report
+    departures = {}
+    arrivals = {}
+    for cutArc in arcs if total else []:
+        tail = network.nodeName(network.tail[cutArc.arc])
+        head = network.nodeName(network.head[cutArc.arc])
+        departures[tail] = departures.get(tail, 0) + cutArc.capacity / total
+        arrivals[head] = arrivals.get(head, 0) + cutArc.capacity / total
+    return CutReport(total, arcs, departures, arrivals)
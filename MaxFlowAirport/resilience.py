@@ -0,0 +1,140 @@
+"""
+N-1 resilience sweep: the max flow lost to every single flight or airport outage
+
+Contingency planning asks how much throughput is lost when one flight is cancelled or one connecting airport
+closes, for every flight and every airport. Each case starts from the solved base flow instead of a new solve: the
+outage is applied to an IncrementalMaxFlow, which reroutes the passengers of the removed arcs around them and only
+cancels what cannot be rerouted, and the base flow is restored for the next case. A flight that carries no
+passengers in the base flow cannot lose any, nor can an airport none of whose flights do, so those cases are
+recorded without work. (Flights that carry passengers but lie outside the minimum cut are still solved: they can
+belong to another cut that their removal makes smaller than the max flow.)
+
+The remaining cases are spread over a pool of worker processes which, with the fork start method, inherit the
+network and the solved base flow read-only; every worker restores its own copy of the residual capacities between
+cases. The result is a table ranked by flow lost.
+
+    python -m MaxFlowAirport.resilience --source LAX --sink JFK --top 20
+"""
+
+
+from collections import namedtuple
+import argparse
+import os
+import sys
+import time
+import numpy as np
+
+from .batch import runPool
+from .cache import loadNetwork
+from .incremental import IncrementalMaxFlow
+from .network import buildNetwork
+from .schedule import readSchedule
+
+
+Outage = namedtuple("Outage", ["kind", "name", "arcs", "flow", "loss", "value"])
+ResilienceReport = namedtuple("ResilienceReport", ["value", "outages", "solved", "skipped", "seconds"])
+
+_base = None
+_snapshot = None
+
+
+def outageCases(network, flows, flights=True, airports=True):
+    """(kind, name, arcs, base flow through them) of every single flight and every connecting airport outage"""
+    flows = np.rint(np.asarray(flows, dtype=np.float64)).astype(np.int64)
+    flightArcs = np.flatnonzero(network.flight >= 0)
+    cases = []
+    if flights:
+        cases += [("flight", network.arcName(arc), [arc], int(flows[arc])) for arc in flightArcs.tolist()]
+    if airports:
+        ends = {network.nodeAirport[network.source], network.nodeAirport[network.sink]}
+        tailAirport = network.nodeAirport[network.tail[flightArcs]]
+        headAirport = network.nodeAirport[network.head[flightArcs]]
+        for index, code in enumerate(network.airports):
+            if index in ends:
+                continue
+            #the passengers through an airport are those landing there, as none of them end their trip there
+            arcs = flightArcs[(tailAirport == index) | (headAirport == index)]
+            if len(arcs):
+                cases.append(("airport", code, arcs.tolist(), int(flows[flightArcs[headAirport == index]].sum())))
+    return cases
+
+
+def initWorker(base):
+    global _base, _snapshot
+    _base = base
+    _snapshot = None
+
+
+def runOutage(case):
+    """Max flow with the arcs of one case removed, from the base flow, which is restored afterwards"""
+    global _snapshot
+    if _snapshot is None:
+        _snapshot = (_base.graph.residual[:], _base.capacity[:], _base.value)
+    value = _base.cancel(case[2])
+    residual, capacity, baseValue = _snapshot
+    _base.graph.residual = residual[:]
+    for arc in case[2]:
+        _base.capacity[arc] = capacity[arc]
+    _base.value = baseValue
+    return value
+
+
+def resilienceSweep(network, flights=True, airports=True, processes=None, chunksize=None, base=None):
+    """
+    Flow lost to the outage of every single flight and every airport other than the source and sink
+
+    base is an IncrementalMaxFlow of the network (solved here if not given). processes=1 runs the cases in this
+    process. Returns a ResilienceReport with the base max flow and an Outage (kind, name, arcs, base flow through
+    them, flow lost, max flow left) for every case, ranked from the largest loss down, plus how many cases were
+    solved and how many were skipped because they carry no flow.
+    """
+    began = time.perf_counter()
+    base = IncrementalMaxFlow(network) if base is None else base
+    cases = outageCases(network, base.flows(), flights, airports)
+    active = [case for case in cases if case[3] > 0]
+    values = runPool(runOutage, active, initWorker, (base,), processes, chunksize)
+    initWorker(None)
+
+    solved = iter(values)
+    outages = []
+    for kind, name, arcs, flow in cases:
+        value = next(solved) if flow > 0 else base.value
+        outages.append(Outage(kind, name, arcs, flow, base.value - value, value))
+    outages.sort(key=lambda outage: (-outage.loss, -outage.flow, outage.kind, outage.name))
+    return ResilienceReport(base.value, outages, len(active), len(cases) - len(active), time.perf_counter() - began)
+
+
+def criticalityTable(report, top=None):
+    """Text table of the outages from the most critical down, with the share of the max flow each one loses"""
+    lines = ["%-4s %-8s %-24s %8s %8s %7s" % ("rank", "kind", "name", "flow", "loss", "share")]
+    for rank, outage in enumerate(report.outages[:top], 1):
+        lines.append("%-4d %-8s %-24s %8d %8d %6.1f%%" % (rank, outage.kind, outage.name, outage.flow, outage.loss,
+                                                           100 * outage.loss / report.value if report.value else 0))
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--schedule", default=os.path.join(os.path.dirname(__file__), "FlightSchedule.csv"),
+                        help="CSV schedule (hourly) or FlightData.txt (minutes)")
+    parser.add_argument("--source", default="LAX")
+    parser.add_argument("--sink", default="JFK")
+    parser.add_argument("--processes", type=int, help="worker processes (default: one per CPU)")
+    parser.add_argument("--top", type=int, help="rows of the table to print (default: all)")
+    parser.add_argument("--no-flights", action="store_true", help="skip single flight outages")
+    parser.add_argument("--no-airports", action="store_true", help="skip airport outages")
+    args = parser.parse_args(argv)
+
+    if args.schedule.endswith(".csv"):
+        network = buildNetwork(readSchedule(args.schedule), args.source, args.sink, start=1, end=24)
+    else:
+        network = loadNetwork(args.schedule, args.source, args.sink, events=True)
+    report = resilienceSweep(network, not args.no_flights, not args.no_airports, args.processes)
+    print("max flow %d, %d outages solved, %d skipped (no flow) in %.2fs" % (report.value, report.solved,
+                                                                              report.skipped, report.seconds))
+    print(criticalityTable(report, args.top))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
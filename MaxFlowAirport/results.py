@@ -0,0 +1,206 @@
+"""
+Cache of max flow query results
+
+Dashboards ask the same questions again and again: the max flow between two airports of a schedule within a time
+window, with some airports closed. A ResultCache keeps the answer of every query under a key made of a hash of the
+schedule contents and the normalized query (airport codes, window, sorted excluded airports, ground capacity), so
+the same question about the same schedule never builds or solves a network twice. Results hold the max flow value,
+the flow on every flight that carries passengers and the flights of the minimum cut, as small NumPy arrays.
+
+The memory tier is an LRU bounded by the bytes of the results it holds: the least recently used results are evicted
+first when a new one does not fit. With a directory set, every result is also written there as one .npz file in an
+atomic write (a temporary file renamed into place), so other processes and later runs find it, and a result evicted
+from memory is read back from disk on its next use. Hits and misses of both tiers are counted. Lookups and stores
+are guarded by a lock, so one cache can serve several threads.
+"""
+
+
+from collections import OrderedDict, namedtuple
+import os
+import tempfile
+import threading
+import weakref
+import numpy as np
+
+from .cache import paramHash, scheduleHash
+from .maxflow import dinic
+from .network import buildEventNetwork
+from .schedule import Schedule
+
+
+QueryResult = namedtuple("QueryResult", ["value", "flights", "flows", "cut"])
+RESULT_ARRAYS = ["flights", "flows", "cut"]
+
+
+def canonicalQuery(source, sink, window=None, excluded=(), groundCapacity=9999):
+    """Canonical form of a query: the window defaults to the day and excluded airports are sorted without repeats"""
+    start, end = window if window is not None else (0, 1440)
+    return (source, sink, int(start), int(end), tuple(sorted(set(excluded) - {source, sink})), int(groundCapacity))
+
+
+def queryMaxFlow(schedule, source, sink, window=None, excluded=(), groundCapacity=9999):
+    """
+    Max flow from source to sink over the event network of the schedule within window (start, end, the day by
+    default) with the flights from and to the excluded airports removed
+
+    Returns a QueryResult with the value, the schedule rows of the flights carrying passengers with their flows and
+    the schedule rows of the flights in the minimum cut.
+    """
+    source, sink, start, end, excluded, groundCapacity = canonicalQuery(source, sink, window, excluded,
+                                                                        groundCapacity)
+    schedule = schedule if isinstance(schedule, Schedule) else Schedule.fromFlights(schedule)
+    closed = np.isin(np.asarray(schedule.airports, dtype=object), list(excluded))
+    rows = np.flatnonzero(~closed[schedule.origin] & ~closed[schedule.destination])
+    kept = Schedule(schedule.airports, schedule.origin[rows], schedule.departure[rows], schedule.destination[rows],
+                    schedule.arrival[rows], schedule.capacity[rows])
+    network = buildEventNetwork(kept, source, sink, start, end, groundCapacity)
+    value, graph = dinic(network)
+    return flowResult(network, graph, value, network.source, rows)
+
+
+def flowResult(network, graph, value, source, rows=None):
+    """
+    QueryResult of a max flow held in a solved residual graph, from its source node; rows maps the flights of the
+    network to the schedule rows reported (the network's own flight numbers by default)
+    """
+    flows = np.array(graph.flows(), dtype=np.int64)
+    carrying = np.flatnonzero((network.flight >= 0) & (flows > 0))
+    sourceSide = np.array(graph.reachable(source), dtype=bool)
+    cut = np.flatnonzero((network.flight >= 0) & sourceSide[network.tail] & ~sourceSide[network.head])
+    flights, cut = network.flight[carrying].astype(np.int64), network.flight[cut].astype(np.int64)
+    if rows is not None:
+        flights, cut = rows[flights], rows[cut]
+    return QueryResult(int(value), flights, flows[carrying], cut)
+
+
+def resultBytes(result):
+    return sum(getattr(result, name).nbytes for name in RESULT_ARRAYS) + 64
+
+
+class ResultCache:
+    """
+    Max flow results by schedule and query, in an LRU memory tier of at most maxBytes and an optional directory
+
+        cache = ResultCache(maxBytes=64 << 20, directory="results")
+        result = cache.maxFlow(schedule, "LAX", "JFK", window=(420, 1080), excluded=["ORD"])
+        print(result.value, cache.stats())
+
+    The hash of a schedule's contents is computed once per Schedule object and remembered, so schedules must be
+    treated as immutable: a schedule whose columns are changed in place keeps its old key (and old results) until
+    forget(schedule) is called; building a new Schedule is the usual way to change one.
+    """
+
+    def __init__(self, maxBytes=64 << 20, directory=None):
+        self.maxBytes = maxBytes
+        self.directory = directory
+        self.entries = OrderedDict()
+        self.bytes = 0
+        self.counts = dict(hits=0, memoryHits=0, diskHits=0, misses=0, evictions=0)
+        self.lock = threading.Lock()
+        #schedule hashes are remembered per schedule object, so repeated queries do not hash the columns again
+        self.digests = weakref.WeakKeyDictionary()
+
+    def key(self, schedule, source, sink, window=None, excluded=(), groundCapacity=9999):
+        """Cache key of a query on a schedule (whose contents are hashed once, see forget)"""
+        try:
+            digest = self.digests.get(schedule)
+        except TypeError:
+            digest = None
+        if digest is None:
+            digest = scheduleHash(schedule)
+            try:
+                self.digests[schedule] = digest
+            except TypeError:
+                pass
+        return digest + "-" + paramHash(query=canonicalQuery(source, sink, window, excluded, groundCapacity))
+
+    def forget(self, schedule):
+        """Drops the remembered hash of a schedule, e.g. after changing its columns in place"""
+        try:
+            self.digests.pop(schedule, None)
+        except TypeError:
+            pass
+
+    def get(self, key):
+        """The cached result of a key, from memory or else from disk, or None"""
+        with self.lock:
+            result = self.entries.get(key)
+            if result is not None:
+                self.entries.move_to_end(key)
+                self.counts["hits"] += 1
+                self.counts["memoryHits"] += 1
+                return result
+        result = self.load(key)
+        with self.lock:
+            if result is None:
+                self.counts["misses"] += 1
+                return None
+            self.counts["hits"] += 1
+            self.counts["diskHits"] += 1
+            self.remember(key, result)
+        return result
+
+    def put(self, key, result):
+        with self.lock:
+            self.remember(key, result)
+        if self.directory:
+            self.save(key, result)
+
+    def remember(self, key, result):
+        """Adds a result to the memory tier and evicts the least recently used ones beyond maxBytes (lock held)"""
+        if key in self.entries:
+            self.bytes -= resultBytes(self.entries.pop(key))
+        size = resultBytes(result)
+        if size > self.maxBytes:
+            return
+        self.entries[key] = result
+        self.bytes += size
+        while self.bytes > self.maxBytes:
+            _, evicted = self.entries.popitem(last=False)
+            self.bytes -= resultBytes(evicted)
+            self.counts["evictions"] += 1
+
+    def path(self, key):
+        return os.path.join(self.directory, key + ".npz")
+
+    def save(self, key, result):
+        os.makedirs(self.directory, exist_ok=True)
+        descriptor, temporary = tempfile.mkstemp(suffix=".tmp", dir=self.directory)
+        try:
+            with os.fdopen(descriptor, "wb") as f:
+                np.savez(f, value=np.int64(result.value), **{name: getattr(result, name) for name in RESULT_ARRAYS})
+            os.replace(temporary, self.path(key))
+        except BaseException:
+            os.unlink(temporary)
+            raise
+
+    def load(self, key):
+        if not self.directory:
+            return None
+        try:
+            with np.load(self.path(key)) as arrays:
+                return QueryResult(int(arrays["value"]), *(arrays[name] for name in RESULT_ARRAYS))
+        except (OSError, KeyError, ValueError):
+            return None
+
+    def maxFlow(self, schedule, source, sink, window=None, excluded=(), groundCapacity=9999):
+        """The result of queryMaxFlow, solved only if no tier holds it yet"""
+        key = self.key(schedule, source, sink, window, excluded, groundCapacity)
+        result = self.get(key)
+        if result is None:
+            result = queryMaxFlow(schedule, source, sink, window, excluded, groundCapacity)
+            self.put(key, result)
+        return result
+
+    def stats(self):
+        """Hit and miss counts of both tiers, evictions, and the entries and bytes held in memory"""
+        with self.lock:
+            lookups = self.counts["hits"] + self.counts["misses"]
+            return dict(self.counts, entries=len(self.entries), bytes=self.bytes,
+                        hitRate=self.counts["hits"] / lookups if lookups else 0.0)
+
+    def clear(self):
+        """Empties the memory tier; results on disk are kept"""
+        with self.lock:
+            self.entries.clear()
+            self.bytes = 0
@@ -0,0 +1,168 @@
+"""
+Rolling-horizon max flow for multi-day schedules
+
+Instead of one event network over a whole week, the horizon is advanced a window at a time. Each window adds the
+events of its flights to an active network that already holds the flow found so far, and Dinic's algorithm
+augments that flow up to the window's last sink event, so the value after the last window is exactly the max flow
+of buildEventNetwork over the whole horizon. Passengers still in transit are simply the flow on the arcs that stay
+active: waiting at an airport, on a flight landing in a later window, or delivered and waiting on at the sink.
+
+After each window everything an augmenting path of a later window can no longer use is dropped with its flow frozen:
+such a path starts at the source and only leaves the window through the last event of an airport or the departure of
+a flight landing later, and it can only reach nodes from the source or, by cancelling flow, from the delivered
+passengers. Whatever is not reachable that way or cannot get to one of those exits never sees its flow change again.
+Once the source side of the cut is saturated the active network shrinks to a handful of nodes and the memory follows
+the size of a window; while it is not (e.g. with unbounded ground capacity) the part of the horizon that can still
+be rerouted stays active, as it has to for the answer to remain exact, and it can come close to the network of the
+whole horizon: over a week of 20000 synthetic flights between 100 airports with a ground capacity of 99999, the
+fifth window holds 38.8k arcs against 58k. Once no path from the source leaves a window the later windows cannot add
+anything and are not built.
+"""
+
+
+from collections import namedtuple
+import numpy as np
+
+from .maxflow import ResidualGraph
+from .network import FlightNetwork, flightColumns
+
+
+RollingResult = namedtuple("RollingResult", ["value", "windows"])
+WindowReport = namedtuple("WindowReport", ["start", "end", "nodes", "arcs", "active"])
+
+
+def rollingMaxFlow(flights, source, sink, start=0, end=7 * 1440, window=1440, groundCapacity=9999):
+    """
+    Max flow from source to sink over start - end, advancing the horizon window minutes at a time
+
+    flights is a Schedule or a sequence of flights in minutes (e.g. scrapeSchedule over several dates). Returns a
+    RollingResult with the value and a WindowReport per window.
+    """
+    if window < 1:
+        raise ValueError("the window must be at least a minute long")
+    airports, airportIndex, origin, destination, departure, arrival, seats = flightColumns(flights, source, sink)
+    sourceIndex, sinkIndex = airportIndex[source], airportIndex[sink]
+    span = end - start + 2
+    used = np.flatnonzero((departure >= start) & (arrival <= end) & (departure < arrival))
+    byDeparture = used[np.argsort(departure[used], kind="stable")]
+    byArrival = used[np.argsort(arrival[used], kind="stable")]
+    departureKey = origin * span + departure - start
+    arrivalKey = destination * span + arrival - start
+    #seats landing at the sink: the flow into its last event is at most its waiting arc plus the flights landing then
+    toSink = byArrival[destination[byArrival] == sinkIndex]
+    sinkSeats = np.concatenate([[0], np.cumsum(seats[toSink])])
+    bound = groundCapacity + int(seats[toSink[arrival[toSink] == end]].sum())
+
+    #the active network carried from window to window, keyed by airport * span + time - start
+    keys = tail = head = capacity = flow = flight = np.empty(0, dtype=np.int64)
+    lastKey = np.full(len(airports), -1, dtype=np.int64)
+    delivered = 0
+    windows = []
+    previous = start - 1
+    while previous < end:
+        finish = min(previous + window, end)
+        #events of the window: departures (also of flights landing later), arrivals and the sink at its end
+        leaving = byDeparture[slice(*np.searchsorted(departure[byDeparture], [previous + 1, finish + 1]))]
+        landing = byArrival[slice(*np.searchsorted(arrival[byArrival], [previous + 1, finish + 1]))]
+        sinkKey = sinkIndex * span + finish - start
+        fresh = np.unique(np.concatenate([departureKey[leaving], arrivalKey[landing], [sinkKey],
+                                          [sourceIndex * span] if previous < start else []]).astype(np.int64))
+        merged = np.concatenate([keys, fresh])
+        merged.sort(kind="stable")
+        remap = np.searchsorted(merged, keys)
+        tail, head = remap[tail], remap[head]
+
+        #flights landing in the window whose departure event is still active
+        position = np.searchsorted(merged, departureKey[landing])
+        found = position < len(merged)
+        found[found] = merged[position[found]] == departureKey[landing][found]
+        landing, flightTail = landing[found], position[found]
+
+        #waiting arcs within the window, and from the last active event of each airport into it
+        freshAirport = fresh // span
+        chain = np.flatnonzero(freshAirport[:-1] == freshAirport[1:])
+        first = np.flatnonzero(np.append(True, freshAirport[1:] != freshAirport[:-1]))
+        previousKey = lastKey[freshAirport[first]]
+        linked = previousKey >= 0
+        linked[linked] = merged[np.minimum(np.searchsorted(merged, previousKey[linked]), len(merged) - 1)] == \
+            previousKey[linked]
+        groundTail = np.concatenate([np.searchsorted(merged, fresh[chain]),
+                                     np.searchsorted(merged, previousKey[linked])])
+        groundHead = np.searchsorted(merged, np.concatenate([fresh[chain + 1], fresh[first[linked]]]))
+        #the passengers already delivered wait on at the sink through the window
+        atSink = np.concatenate([freshAirport[chain], freshAirport[first[linked]]]) == sinkIndex
+        groundFlow = np.where(atSink, delivered, 0)
+
+        numNodes = len(merged)
+        virtual = numNodes
+        sinkNode = int(np.searchsorted(merged, sinkKey))
+        final = finish == end
+        nodeAirport = np.append(merged // span, sinkIndex)
+        nodeTime = np.append(merged % span + start, finish + 1)
+        tail = np.concatenate([tail, groundTail, flightTail, [sinkNode]])
+        head = np.concatenate([head, groundHead, np.searchsorted(merged, arrivalKey[landing]), [virtual]])
+        capacity = np.concatenate([capacity, np.full(len(groundTail), groundCapacity, dtype=np.int64), seats[landing],
+                                   [0 if final else groundCapacity]])
+        flight = np.concatenate([flight, np.full(len(groundTail), -1, dtype=np.int64), landing, [-1]])
+        flow = np.concatenate([flow, groundFlow, np.zeros(len(landing), dtype=np.int64), [0 if final else delivered]])
+        network = FlightNetwork(airports, nodeAirport, nodeTime, tail, head, capacity, flight, None,
+                                int(np.searchsorted(merged, sourceIndex * span)), sinkNode if final else virtual,
+                                clock=True)
+        graph = ResidualGraph(network)
+        graph.setFlows(flow)
+        delivered += graph.maxFlow(network.source, network.sink)
+        if final:
+            windows.append(WindowReport(previous + 1, finish, network.numNodes, network.numArcs, 0))
+            break
+
+        #only the airports' last events and the departures of flights landing later lead on into later windows:
+        #keep what the source or the delivered passengers can still reach and that can get to one of them
+        updated = np.append(np.flatnonzero(freshAirport[1:] != freshAirport[:-1]), len(fresh) - 1)
+        lastKey[freshAirport[updated]] = fresh[updated]
+        flying = byArrival[np.searchsorted(arrival[byArrival], finish + 1):]
+        exits = np.concatenate([lastKey[lastKey >= 0], departureKey[flying[departure[flying] <= finish]]])
+        #cancelling delivered flow only helps once the waiting arcs of the sink can fill up
+        landingLater = int(sinkSeats[np.searchsorted(arrival[toSink], end)] -
+                           sinkSeats[np.searchsorted(arrival[toSink], finish + 1)])
+        seeds = [network.source] + ([sinkNode] if delivered + landingLater >= groundCapacity else [])
+        keep = activeNodes(graph, seeds, np.searchsorted(merged, exits[np.isin(exits, merged)]))
+        windows.append(WindowReport(previous + 1, finish, network.numNodes, network.numArcs, int(keep.sum())))
+        if not keep[network.source] or delivered >= bound:
+            #no path from the source leaves the window or the sink is full, later flights cannot add to the flow
+            break
+        keep[sinkNode] = True
+        keep = keep[:numNodes]
+        index = np.cumsum(keep) - 1
+
+        #the arc to the window's sink goes, the delivered passengers wait on from the window's last sink event
+        flow = np.array(graph.flows()[:-1], dtype=np.int64)
+        tail, head, capacity, flight = tail[:-1], head[:-1], capacity[:-1], flight[:-1]
+        inside = np.flatnonzero(keep[tail] & keep[head])
+        keys, tail, head = merged[keep], index[tail[inside]], index[head[inside]]
+        capacity, flow, flight = capacity[inside], flow[inside], flight[inside]
+        previous = finish
+    return RollingResult(delivered, windows)
+
+
+def activeNodes(graph, sources, exits):
+    """
+    Nodes reachable from any of the sources in the residual graph from which one of the exits can be reached, as a
+    boolean array
+    """
+    head, residual, start, arcs = graph.head, graph.residual, graph.start, graph.arcs
+    reach = np.zeros(graph.numNodes, dtype=bool)
+    for source in sources:
+        reach |= np.array(graph.reachable(source))
+    seen = [False] * graph.numNodes
+    stack = [int(node) for node in exits if reach[node]]
+    for node in stack:
+        seen[node] = True
+    while stack:
+        v = stack.pop()
+        for i in range(start[v], start[v + 1]):
+            e = arcs[i]
+            u = head[e]
+            if residual[e ^ 1] > 0 and not seen[u] and reach[u]:
+                seen[u] = True
+                stack.append(u)
+    return np.array(seen, dtype=bool)
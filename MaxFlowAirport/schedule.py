@@ -0,0 +1,71 @@
+"""
+Flight schedule records for the airport max flow network
+
+A schedule is a list of flights, each one described by its origin airport, departure time, destination airport,
+arrival time and seat capacity (e.g. LAX,7,JFK,15,375 = flight leaving LAX at 7 AM, arriving in JFK at 3 PM with
+375 seats). Times are integers in the same unit as the horizon of the network they are built into, or minutes
+since midnight for scraped schedules. Large schedules are held as a Schedule, which interns the airport codes and
+stores every field as a compact NumPy column while still reading back as a sequence of flights.
+"""
+
+
+from collections import namedtuple
+import csv
+import numpy as np
+
+
+Flight = namedtuple("Flight", ["origin", "departure", "destination", "arrival", "capacity"])
+
+
+def readSchedule(path):
+    """Reads a CSV schedule with origin,departure,destination,arrival,capacity columns into a list of flights"""
+    flights = []
+    with open(path, newline="") as f:
+        for row in csv.DictReader(f):
+            flights.append(Flight(row["origin"].strip(), int(row["departure"]), row["destination"].strip(),
+                                  int(row["arrival"]), int(row["capacity"])))
+    return flights
+
+
+class Schedule:
+    """Columnar schedule: airport and aircraft tables plus one int32 NumPy array per flight field"""
+
+    def __init__(self, airports, origin, departure, destination, arrival, capacity, aircraft=None,
+                 aircraftTypes=None, airportNames=None):
+        self.airports = airports
+        self.origin = np.asarray(origin, dtype=np.int32)
+        self.departure = np.asarray(departure, dtype=np.int32)
+        self.destination = np.asarray(destination, dtype=np.int32)
+        self.arrival = np.asarray(arrival, dtype=np.int32)
+        self.capacity = np.asarray(capacity, dtype=np.int32)
+        self.aircraft = np.full(len(self.origin), -1, dtype=np.int32) if aircraft is None else \
+            np.asarray(aircraft, dtype=np.int32)
+        self.aircraftTypes = aircraftTypes or []
+        self.airportNames = airportNames or {}
+
+    @classmethod
+    def fromFlights(cls, flights):
+        """Interns the airport codes of a sequence of flights into a columnar schedule"""
+        airportIndex = {}
+        origin = [airportIndex.setdefault(f.origin, len(airportIndex)) for f in flights]
+        destination = [airportIndex.setdefault(f.destination, len(airportIndex)) for f in flights]
+        return cls(list(airportIndex), origin, [f.departure for f in flights], destination,
+                   [f.arrival for f in flights], [f.capacity for f in flights])
+
+    def __len__(self):
+        return len(self.origin)
+
+    def __getitem__(self, i):
+        return Flight(self.airports[self.origin[i]], int(self.departure[i]), self.airports[self.destination[i]],
+                      int(self.arrival[i]), int(self.capacity[i]))
+
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
+
+    def unique(self):
+        """Drops repeated legs, as scraped itineraries list a shared connecting flight once per itinerary"""
+        rows = np.stack([self.origin, self.departure, self.destination, self.arrival, self.aircraft], axis=1)
+        kept = np.sort(np.unique(rows, axis=0, return_index=True)[1])
+        return Schedule(self.airports, self.origin[kept], self.departure[kept], self.destination[kept],
+                        self.arrival[kept], self.capacity[kept], self.aircraft[kept], self.aircraftTypes,
+                        self.airportNames)
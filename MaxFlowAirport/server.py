@@ -0,0 +1,259 @@
+"""
+Resident max flow query server over HTTP or a Unix socket
+
+Every run of the package scripts pays for reading the schedule, building its network and setting up the solver
+before answering a single question. A QueryService loads each schedule once, builds one event network of the whole
+schedule (as maxFlowBatch does, a query from the first event of the source at or after the start of its window to
+the last event of the sink at or before its end only uses flights inside the window) and then answers queries from
+memory: a query costs one Dinic solve on a residual graph kept per thread and reset between queries, and repeated
+queries are answered by a ResultCache without solving. Results are those of queryMaxFlow, which the cache shares:
+when a window edge is not an event of the airport, the query network passes all of its flow through one waiting
+arc of the ground capacity, so a query that reaches that capacity is solved on its own network instead. The
+networks and schedules are only read after loading, so any number of threads can query them at once; the latency
+of every query is recorded and reported as percentiles.
+
+    python -m MaxFlowAirport.server --schedule week=FlightWebscraping/FlightData.txt --port 8000
+    curl "localhost:8000/maxflow?schedule=week&source=LAX&sink=JFK&start=360&end=1440"
+    curl localhost:8000/stats
+
+With --socket PATH the same HTTP interface listens on a Unix socket instead (curl --unix-socket PATH ...).
+"""
+
+
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import argparse
+import json
+import os
+import socketserver
+import sys
+import threading
+import time
+from urllib.parse import parse_qs, urlsplit
+import numpy as np
+
+from .batch import windowNodes
+from .cache import loadSchedule
+from .maxflow import ResidualGraph
+from .network import buildEventNetwork
+from .results import QueryResult, ResultCache, flowResult, queryMaxFlow
+from .schedule import Schedule, readSchedule
+
+
+class LatencyRecorder:
+    """Thread-safe record of the latest query latencies, summarized as percentiles in milliseconds"""
+
+    def __init__(self, samples=100000):
+        self.seconds = deque(maxlen=samples)
+        self.count = 0
+        self.lock = threading.Lock()
+
+    def record(self, seconds):
+        with self.lock:
+            self.seconds.append(seconds)
+            self.count += 1
+
+    def summary(self):
+        with self.lock:
+            seconds = np.array(self.seconds, dtype=np.float64)
+            count = self.count
+        if not len(seconds):
+            return dict(count=count, p50=0.0, p90=0.0, p99=0.0, max=0.0)
+        p50, p90, p99 = (np.percentile(seconds, [50, 90, 99]) * 1e3).tolist()
+        return dict(count=count, p50=p50, p90=p90, p99=p99, max=float(seconds.max()) * 1e3)
+
+
+class QueryService:
+    """
+    Named schedules with their event networks preloaded, answering (source, sink, window) max flow queries
+
+        service = QueryService()
+        service.load("week", "FlightWebscraping/FlightData.txt")
+        result = service.query("week", "LAX", "JFK", (360, 1440))
+        print(result.value, service.stats()["latency"]["p99"])
+    """
+
+    def __init__(self, cache=None, groundCapacity=9999, samples=100000):
+        self.cache = ResultCache() if cache is None else cache
+        self.groundCapacity = groundCapacity
+        self.schedules = {}
+        self.networks = {}
+        self.latency = LatencyRecorder(samples)
+        self.local = threading.local()
+        self.lock = threading.Lock()
+
+    def load(self, name, schedule):
+        """
+        Loads a schedule under a name: a Schedule, a sequence of flights, a CSV schedule (readSchedule) or a
+        FlightData.txt file (loadSchedule, memory-mapped from its cache); returns its event network
+        """
+        if isinstance(schedule, str):
+            schedule = readSchedule(schedule) if schedule.endswith(".csv") else loadSchedule(schedule)
+        if not isinstance(schedule, Schedule):
+            schedule = Schedule.fromFlights(schedule)
+        if not len(schedule.airports):
+            raise ValueError("schedule %r has no flights" % name)
+        start = min(0, int(schedule.departure.min(initial=0)))
+        end = max(1440, int(schedule.arrival.max(initial=0)))
+        network = buildEventNetwork(schedule, schedule.airports[0], schedule.airports[-1], start, end,
+                                    self.groundCapacity)
+        network.horizon = (start, end)
+        with self.lock:
+            self.schedules[name] = schedule
+            self.networks[name] = network
+        return network
+
+    def graph(self, name):
+        """Residual graph of a network for the calling thread, reset to no flow"""
+        graphs = self.local.__dict__.setdefault("graphs", {})
+        network = self.networks[name]
+        built, graph = graphs.get(name, (None, None))
+        if built is not network:
+            graph = ResidualGraph(network)
+            graphs[name] = network, graph
+        else:
+            graph.reset()
+        return graph
+
+    def query(self, name, source, sink, window=None):
+        """QueryResult of the max flow from source to sink within window (the whole schedule by default)"""
+        began = time.perf_counter()
+        if name not in self.networks:
+            raise KeyError(name)
+        schedule, network = self.schedules[name], self.networks[name]
+        window = tuple(int(value) for value in window) if window is not None else network.horizon
+        key = self.cache.key(schedule, source, sink, window, (), self.groundCapacity)
+        result = self.cache.get(key)
+        if result is None:
+            first, last, exact = windowNodes(network, source, sink, window)
+            if source == sink:
+                result = queryMaxFlow(schedule, source, sink, window, (), self.groundCapacity)
+            elif first < 0 or last < 0:
+                empty = np.empty(0, dtype=np.int64)
+                result = QueryResult(0, empty, empty, empty)
+            else:
+                graph = self.graph(name)
+                value = graph.maxFlow(first, last)
+                if exact or value < self.groundCapacity:
+                    result = flowResult(network, graph, value, first)
+                else:
+                    #the waiting arc of the ground capacity at a window edge binds: solve the query network itself
+                    result = queryMaxFlow(schedule, source, sink, window, (), self.groundCapacity)
+            self.cache.put(key, result)
+        self.latency.record(time.perf_counter() - began)
+        return result
+
+    def stats(self):
+        """Query latency percentiles (milliseconds), cache statistics and the size of every loaded network"""
+        with self.lock:
+            networks = {name: dict(flights=len(self.schedules[name].origin), nodes=network.numNodes,
+                                   arcs=network.numArcs, horizon=list(network.horizon))
+                        for name, network in self.networks.items()}
+        return dict(latency=self.latency.summary(), cache=self.cache.stats(), schedules=networks)
+
+
+class QueryHandler(BaseHTTPRequestHandler):
+    """GET /maxflow?schedule=&source=&sink=[&start=&end=][&flights=1], GET /stats and GET /schedules as JSON"""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        params = {name: values[-1] for name, values in parse_qs(url.query).items()}
+        service = self.server.service
+        try:
+            if url.path == "/maxflow":
+                window = None
+                if "start" in params or "end" in params:
+                    horizon = service.networks[params["schedule"]].horizon
+                    window = (int(params.get("start", horizon[0])), int(params.get("end", horizon[1])))
+                result = service.query(params["schedule"], params["source"], params["sink"], window)
+                body = dict(value=result.value, cut=result.cut.tolist())
+                if params.get("flights") in ("1", "true"):
+                    body.update(flights=result.flights.tolist(), flows=result.flows.tolist())
+                self.reply(200, body)
+            elif url.path == "/stats":
+                self.reply(200, service.stats())
+            elif url.path == "/schedules":
+                self.reply(200, sorted(service.networks))
+            else:
+                self.reply(404, dict(error="unknown path %s" % url.path))
+        except KeyError as error:
+            self.reply(400, dict(error="missing or unknown %s" % error))
+        except ValueError as error:
+            self.reply(400, dict(error=str(error)))
+
+    def reply(self, status, body):
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def address_string(self):
+        #Unix socket clients have no host address
+        return self.client_address[0] if isinstance(self.client_address, tuple) else "unix"
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+class UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def server_bind(self):
+        if os.path.exists(self.server_address):
+            os.unlink(self.server_address)
+        super().server_bind()
+
+
+def makeServer(service, port=8000, host="127.0.0.1", socket=None, verbose=False):
+    """Threaded HTTP server of a QueryService on host:port, or on the Unix socket path socket when given"""
+    if socket:
+        server = UnixHTTPServer(socket, QueryHandler)
+    else:
+        server = ThreadingHTTPServer((host, port), QueryHandler)
+        server.daemon_threads = True
+    server.service = service
+    server.verbose = verbose
+    return server
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--schedule", action="append", required=True,
+                        help="NAME=PATH of a FlightData.txt or CSV schedule to load (repeatable)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--socket", help="listen on this Unix socket path instead of host:port")
+    parser.add_argument("--cache-bytes", type=int, default=64 << 20, help="memory for cached query results")
+    parser.add_argument("--cache-dir", help="also keep query results in this directory")
+    parser.add_argument("--ground-capacity", type=int, default=9999)
+    parser.add_argument("--verbose", action="store_true", help="log every request")
+    args = parser.parse_args(argv)
+
+    service = QueryService(ResultCache(args.cache_bytes, args.cache_dir), args.ground_capacity)
+    for entry in args.schedule:
+        name, _, path = entry.rpartition("=")
+        name = name or os.path.splitext(os.path.basename(path))[0]
+        began = time.perf_counter()
+        network = service.load(name, path)
+        print("loaded %s: %d nodes, %d arcs in %.2fs" % (name, network.numNodes, network.numArcs,
+                                                           time.perf_counter() - began), file=sys.stderr)
+    server = makeServer(service, args.port, args.host, args.socket, args.verbose)
+    print("serving on %s" % (args.socket or "http://%s:%d" % (args.host, args.port)), file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if args.socket and os.path.exists(args.socket):
+            os.unlink(args.socket)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
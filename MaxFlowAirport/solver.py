@@ -0,0 +1,200 @@
+"""
+Solvers for the time-expanded airport network
+
+The PuLP backend writes the network as a linear program with one edge variable per arc, bounded by the arc capacity,
+and one conservation constraint per node (flow into the node = flow out of it), and maximizes the flow reaching the
+sink. This is the same model that used to be written out by hand for the LAX -> JFK network. The dinic backend
+solves the same problem in process with the combinatorial engine in maxflow, which avoids writing the model to disk
+and spawning CBC and is much faster on large networks. The highs backend builds the same linear program without a
+Python object per variable or term: the node-arc incidence matrix of the conservation constraints, the capacity
+bounds and the objective are SciPy and NumPy arrays made in a few vectorized passes and handed to the HiGHS solver
+bundled with SciPy in process, with no model file. SciPy is only imported by the highs backend, before its timed
+phases. Passing an Instrument times every phase of a solve and records the size of the model. With prune=True any
+backend solves the network reduced by pruneNetwork to the arcs that can carry flow, with its waiting chains
+contracted.
+"""
+
+
+from collections import namedtuple
+import numpy as np
+import pulp as p
+
+from .instrument import modelSize, phase, timedMethod
+from .maxflow import ResidualGraph
+from .prune import expandFlows, pruneNetwork
+
+
+FlowResult = namedtuple("FlowResult", ["value", "flows"])
+BACKENDS = ("pulp", "dinic", "highs")
+
+
+class MatrixModel:
+    """Linear program of a network as arrays: maximize objective @ x subject to equality @ x = 0 within the bounds"""
+
+    def __init__(self, objective, equality, bounds):
+        self.objective = objective
+        self.equality = equality
+        self.bounds = bounds
+        self.solution = None
+
+
+def buildProblem(network, instrument=None):
+    """Returns the PuLP problem for the network and its edge variables in arc order"""
+    airportFlow = p.LpProblem('airportProblem', p.LpMaximize)
+
+    #edge variables, numbering repeated flights like Edge2ATL21,JFK23
+    with phase(instrument, "variables"):
+        edges = []
+        seen = {}
+        for arc in range(network.numArcs):
+            name = network.arcName(arc)
+            seen[name] = seen.get(name, 0) + 1
+            prefix = "Edge" if seen[name] == 1 else "Edge" + str(seen[name])
+            edges.append(p.LpVariable(prefix + name, lowBound=0, upBound=int(network.capacity[arc])))
+
+    #objective function
+    sink = network.sink
+    with phase(instrument, "objective"):
+        airportFlow += p.LpAffineExpression([(edges[a], 1) for a in network.incoming(sink)] +
+                                            [(edges[a], -1) for a in network.outgoing(sink)])
+
+    #conservation constraints for every node other than the source and sink
+    with phase(instrument, "constraints"):
+        for node in range(network.numNodes):
+            if node == network.source or node == sink:
+                continue
+            terms = [(edges[a], 1) for a in network.incoming(node)] + \
+                [(edges[a], -1) for a in network.outgoing(node)]
+            if terms:
+                airportFlow += p.LpConstraint(p.LpAffineExpression(terms), p.LpConstraintEQ, rhs=0)
+
+    return airportFlow, edges
+
+
+def buildMatrices(network, instrument=None):
+    """
+    Returns the MatrixModel of the network: the same variables, objective and constraints as buildProblem, with a
+    conservation row for every node other than the source and sink that has arcs
+    """
+    from scipy.sparse import csr_matrix
+
+    tail, head, sink = network.tail, network.head, network.sink
+    with phase(instrument, "variables"):
+        bounds = np.column_stack([np.zeros(network.numArcs), network.capacity.astype(np.float64)])
+    with phase(instrument, "objective"):
+        objective = (head == sink).astype(np.float64) - (tail == sink)
+    with phase(instrument, "constraints"):
+        constrained = np.zeros(network.numNodes, dtype=bool)
+        constrained[tail] = constrained[head] = True
+        constrained[[network.source, sink]] = False
+        row = np.cumsum(constrained) - 1
+        into, out = np.flatnonzero(constrained[head]), np.flatnonzero(constrained[tail])
+        equality = csr_matrix((np.concatenate([np.ones(len(into)), -np.ones(len(out))]),
+                               (np.concatenate([row[head[into]], row[tail[out]]]), np.concatenate([into, out]))),
+                              shape=(int(constrained.sum()), network.numArcs))
+    return MatrixModel(objective, equality, bounds)
+
+
+def loadBackend(backend):
+    """Imports the SciPy modules the highs backend loads lazily, so that timing its model and solve leaves them out"""
+    if backend == "highs":
+        import scipy.optimize
+        import scipy.sparse
+
+
+def buildModel(network, backend="pulp", instrument=None):
+    """Builds the backend's model of the network: a PuLP problem with its edges, a residual graph or a MatrixModel"""
+    if backend == "pulp":
+        return buildProblem(network, instrument)
+    if backend == "dinic":
+        return ResidualGraph(network)
+    if backend == "highs":
+        return buildMatrices(network, instrument)
+    raise ValueError("unknown max flow backend %r" % (backend,))
+
+
+def solveModel(network, model, backend="pulp", msg=False, instrument=None):
+    """Solves a built model; with an instrument the PuLP solve is split into writing the model, CBC and reading"""
+    if backend == "dinic":
+        model.maxFlow(network.source, network.sink)
+        return
+    if backend == "highs":
+        from scipy.optimize import linprog
+
+        #linprog rejects a problem without variables, whose max flow is 0
+        if not len(model.objective):
+            model.solution = np.zeros(0)
+            return
+        result = linprog(-model.objective, A_eq=model.equality, b_eq=np.zeros(model.equality.shape[0]),
+                         bounds=model.bounds, method="highs")
+        if result.status != 0:
+            raise RuntimeError("max flow LP not solved: %s" % result.message)
+        model.solution = result.x
+        return
+    solver = p.PULP_CBC_CMD(msg=msg)
+    if instrument is None:
+        model[0].solve(solver)
+        return
+
+    #time writing the model file and reading the solution file inside the solve, the rest of it is the CBC run
+    files = lambda: sum(instrument.phases[name]["seconds"] for name in ("write", "read") if name in instrument.phases)
+    before = files()
+    restore = [timedMethod(instrument, "write", model[0], "writeMPS"),
+               timedMethod(instrument, "read", solver, "readsol_MPS")]
+    try:
+        with instrument.phase("cbc"):
+            model[0].solve(solver)
+    finally:
+        for undo in restore:
+            undo()
+    instrument.phases["cbc"]["seconds"] -= files() - before
+
+
+def extractResult(network, model, backend="pulp"):
+    """Reads the max flow value and the flow on every arc back from a solved model"""
+    if backend == "pulp":
+        airportFlow, edges = model
+        #an objective without terms (no arc at the sink) has no value
+        sink = network.sink
+        value = p.value(airportFlow.objective) if len(network.incoming(sink)) + len(network.outgoing(sink)) else 0
+        return FlowResult(value, [edge.varValue for edge in edges])
+    if backend == "highs":
+        return FlowResult(float(model.objective @ model.solution), model.solution.tolist())
+    flows = model.flows()
+    sink = network.sink
+    return FlowResult(sum(flows[a] for a in network.incoming(sink)) - sum(flows[a] for a in network.outgoing(sink)),
+                      flows)
+
+
+def solve(network, backend="pulp", msg=False, instrument=None, prune=False):
+    """
+    Solves the max flow of the network and returns its value with the flow on every arc
+
+    instrument (an Instrument) collects the time and memory of the model, solve and extract phases and the model
+    size counters. prune=True solves the network left by pruneNetwork (dead arcs dropped, waiting chains contracted)
+    and maps its flow back to every arc of the network; the counters are then those of the pruned model, with the
+    original sizes as originalNodes and originalArcs.
+    """
+    if prune:
+        with phase(instrument, "prune"):
+            pruned = pruneNetwork(network)
+        if not pruned.network.numArcs:
+            #the sink cannot be reached, no model to build
+            return FlowResult(0, [0.0] * network.numArcs)
+        result = solve(pruned.network, backend, msg, instrument)
+        if instrument is not None:
+            instrument.count(originalNodes=network.numNodes, originalArcs=network.numArcs)
+        return FlowResult(result.value, expandFlows(pruned, result.flows))
+    if instrument is None:
+        model = buildModel(network, backend)
+        solveModel(network, model, backend, msg)
+        return extractResult(network, model, backend)
+
+    loadBackend(backend)
+    instrument.count(backend=backend, **modelSize(network))
+    with instrument.phase("model"):
+        model = buildModel(network, backend, instrument)
+    with instrument.phase("solve"):
+        solveModel(network, model, backend, msg, instrument)
+    with instrument.phase("extract"):
+        return extractResult(network, model, backend)
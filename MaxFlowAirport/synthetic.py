@@ -0,0 +1,69 @@
+"""
+Synthetic hub-and-spoke flight schedules for testing and benchmarking
+
+Airports are scattered on a plane and a few of them are made hubs. Spoke airports fly mostly to hubs and hubs fly
+to each other, with flight times growing with distance and departures spread over the horizon. Every flight gets
+an aircraft type drawn from a weighted fleet mix, and its seats come from the same capacity table the FlightData.txt
+parser uses, so a generated schedule can be written out in the scraper's text format (writeScheduleData) and parsed
+back.
+"""
+
+
+import numpy as np
+
+from .flightdata import SEAT_CAPACITY, seatCapacity
+from .schedule import Schedule
+
+
+#share of each aircraft type in the generated fleet
+FLEET_MIX = {
+    "Embraer RJ-175": 0.15,
+    "Airbus A319": 0.15,
+    "Airbus A320": 0.1,
+    "Boeing 737": 0.3,
+    "Airbus A321": 0.15,
+    "Boeing 757": 0.08,
+    "Boeing 767": 0.05,
+    "Boeing 777": 0.02,
+}
+
+
+def airportCodes(count):
+    """Three letter codes AAA, AAB, ... for synthetic airports"""
+    letters = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+    return [letters[i // 676 % 26] + letters[i // 26 % 26] + letters[i % 26] for i in range(count)]
+
+
+def syntheticSchedule(airports=50, flights=1000, hubs=None, start=0, end=1440, fleet=FLEET_MIX,
+                      capacities=SEAT_CAPACITY, hubShare=0.8, seed=0):
+    """
+    Generates a hub-and-spoke Schedule with times in minutes between start and end
+
+    hubs defaults to a tenth of the airports (at least one) and hubShare is the share of flights with a hub at
+    either end. The same seed always gives the same schedule.
+    """
+    random = np.random.default_rng(seed)
+    codes = airportCodes(airports)
+    hubs = hubs or max(1, airports // 10)
+    position = random.uniform(0, 2500, size=(airports, 2))
+
+    #hub flights have a hub at one end (either direction), the others connect any two distinct airports
+    viaHub = random.random(flights) < hubShare
+    origin = np.where(viaHub, random.integers(0, hubs, size=flights), random.integers(0, airports, size=flights))
+    destination = (origin + 1 + random.integers(0, airports - 1, size=flights)) % airports
+    swap = viaHub & (random.random(flights) < 0.5)
+    origin, destination = np.where(swap, destination, origin), np.where(swap, origin, destination)
+
+    #flight times from distance (about 500 miles an hour plus 30 minutes on the ground), departures over the horizon
+    distance = np.hypot(*(position[origin] - position[destination]).T)
+    duration = np.minimum((30 + distance / 500 * 60).astype(np.int64), max(1, (end - start) // 2))
+    departure = start + (random.random(flights) * (end - start - duration)).astype(np.int64)
+    arrival = departure + duration
+
+    types = list(fleet)
+    weights = np.array([fleet[kind] for kind in types], dtype=float)
+    aircraft = random.choice(len(types), size=flights, p=weights / weights.sum())
+    seats = np.array([seatCapacity(kind, capacities) for kind in types], dtype=np.int64)[aircraft]
+
+    return Schedule(codes, origin, departure, destination, arrival, seats, aircraft, types,
+                    {code: "Synthetic Airport" for code in codes})
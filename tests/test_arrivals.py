@@ -0,0 +1,49 @@
+"""
+Arrival profile against a separate max flow solve for every deadline
+"""
+
+
+import os
+
+import pytest
+
+from MaxFlowAirport import ResidualGraph, arrivalProfile, buildEventNetwork, buildNetwork, dinic, readFlightData
+from MaxFlowAirport.synthetic import syntheticSchedule
+
+
+FLIGHT_DATA = os.path.join(os.path.dirname(__file__), "..", "FlightWebscraping", "FlightData.txt")
+
+
+def deadlineMaxFlows(network, deadlines):
+    values = []
+    for deadline in deadlines:
+        node = network.lastNode(network.airports[network.nodeAirport[network.sink]], deadline)
+        values.append(ResidualGraph(network).maxFlow(network.source, node) if node >= 0 else 0)
+    return values
+
+
+@pytest.mark.parametrize("groundCapacity", [400, 9999])
+def test_profile_matches_deadline_solves(groundCapacity):
+    schedule = syntheticSchedule(20, 800, seed=6)
+    for source, sink in [(schedule.airports[0], schedule.airports[5]), (schedule.airports[9], schedule.airports[0])]:
+        network = buildEventNetwork(schedule, source, sink, groundCapacity=groundCapacity)
+        profile = arrivalProfile(network)
+        assert profile.times == sorted(profile.times) and len(profile.times) > 1
+        assert profile.values == deadlineMaxFlows(network, profile.times)
+
+
+def test_hourly_network_with_deadlines():
+    network = buildNetwork(readFlightData(FLIGHT_DATA).unique(), "LAX", "JFK", 0, 1440, 600, step=60)
+    deadlines = list(range(0, 1500, 60)) + [-60, 1000]
+    profile = arrivalProfile(network, deadlines)
+    assert profile.times == sorted(set(deadlines))
+    assert profile.values == deadlineMaxFlows(network, profile.times)
+
+
+def test_search_tree_kept_between_deadlines():
+    schedule = syntheticSchedule(40, 2000, seed=2)
+    network = buildEventNetwork(schedule, schedule.airports[0], schedule.airports[1])
+    profile = arrivalProfile(network)
+    assert profile.values == deadlineMaxFlows(network, profile.times)
+    assert profile.values[-1] == dinic(network)[0]
+    assert profile.searches < len(profile.times) / 2
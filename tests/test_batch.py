@@ -0,0 +1,39 @@
+"""
+Batched max flow queries against the event network of every query window
+"""
+
+
+import os
+
+import pytest
+
+from MaxFlowAirport import allPairs, buildEventNetwork, dinic, maxFlowBatch, readFlightData
+from MaxFlowAirport.synthetic import syntheticSchedule
+
+
+FLIGHT_DATA = os.path.join(os.path.dirname(__file__), "..", "FlightWebscraping", "FlightData.txt")
+
+
+def test_batch_on_scraped_schedule():
+    schedule = readFlightData(FLIGHT_DATA).unique()
+    network = buildEventNetwork(schedule, "LAX", "JFK")
+    queries = allPairs(["LAX", "JFK", "CLT", "ATL", "DFW"], (0, 1440)) + allPairs(["LAX", "JFK", "ORD"], (420, 1200))
+    for processes in (1, 2):
+        report = maxFlowBatch(network, queries, processes=processes)
+        assert len(report.values) == len(queries) and any(report.values)
+        for (source, sink, (start, end)), value in zip(report.queries, report.values):
+            expected, _ = dinic(buildEventNetwork(schedule, source, sink, start, end))
+            assert value == expected, (source, sink, start, end)
+
+
+@pytest.mark.parametrize("groundCapacity", [200, 9999])
+def test_batch_matches_query_networks(groundCapacity):
+    schedule = syntheticSchedule(50, 6000, seed=1)
+    network = buildEventNetwork(schedule, schedule.airports[0], schedule.airports[-1], 0, 1440, groundCapacity)
+    airports = schedule.airports[:6]
+    queries = [(source, sink, window) for source in airports for sink in airports if source != sink
+               for window in [(0, 1440), (360, 1080)]]
+    report = maxFlowBatch(network, queries, processes=1)
+    for (source, sink, (start, end)), value in zip(queries, report.values):
+        expected, _ = dinic(buildEventNetwork(schedule, source, sink, start, end, groundCapacity))
+        assert value == expected, (source, sink, start, end)
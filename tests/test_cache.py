@@ -0,0 +1,62 @@
+"""
+Memory-mapped cache of parsed schedules and built networks
+"""
+
+
+import os
+import shutil
+
+import numpy as np
+import pytest
+
+from MaxFlowAirport import buildNetwork, dinic, loadNetwork, loadSchedule, readFlightData
+from MaxFlowAirport.cache import fileHash
+
+
+FLIGHT_DATA = os.path.join(os.path.dirname(__file__), "..", "FlightWebscraping", "FlightData.txt")
+
+
+def mapped(values):
+    while values is not None and not isinstance(values, np.memmap):
+        values = values.base
+    return values is not None
+
+
+@pytest.fixture
+def flightData(tmp_path):
+    path = str(tmp_path / "FlightData.txt")
+    shutil.copy(FLIGHT_DATA, path)
+    return path
+
+
+def test_schedule_round_trip(flightData):
+    expected = readFlightData(flightData).unique()
+    for attempt in range(2):
+        schedule = loadSchedule(flightData)
+        assert mapped(schedule.origin)
+        assert list(schedule.airports) == list(expected.airports)
+        assert list(schedule) == list(expected)
+
+
+def test_network_round_trip(flightData):
+    expected = buildNetwork(readFlightData(flightData).unique(), "LAX", "JFK", start=0, end=1440, step=60)
+    for attempt in range(2):
+        network = loadNetwork(flightData, "LAX", "JFK", start=0, end=1440)
+        for name in ("nodeAirport", "nodeTime", "tail", "head", "capacity", "flight", "outStart", "outArcs"):
+            assert np.array_equal(getattr(network, name), getattr(expected, name)), name
+        assert mapped(network.tail)
+        assert dinic(network)[0] == dinic(expected)[0]
+
+
+def test_changed_file_replaces_stale_entries(flightData):
+    loadNetwork(flightData, "LAX", "JFK", start=0, end=1440)
+    with open(flightData, encoding="utf-8") as f:
+        records = f.read().split("\n\n")
+    with open(flightData, "w", encoding="utf-8") as f:
+        f.write("\n\n".join(records[:len(records) // 2]) + "\n\n")
+
+    schedule = loadSchedule(flightData)
+    assert list(schedule) == list(readFlightData(flightData).unique())
+    digest = fileHash(flightData)
+    entries = os.listdir(os.path.join(os.path.dirname(flightData), "__flightcache__"))
+    assert entries and all(entry.startswith("FlightData.txt.%s." % digest) for entry in entries)
@@ -0,0 +1,44 @@
+"""
+FlightData.txt records written from schedules and scraped legs and parsed back
+"""
+
+
+import os
+
+import pytest
+
+from MaxFlowAirport import Schedule, ScheduleBuilder, readFlightData, readSchedule, seatCapacity, writeScheduleData
+from MaxFlowAirport.synthetic import syntheticSchedule
+from FlightWebscraping.scraper import legRecord, writeFlightData
+
+
+FLIGHT_SCHEDULE = os.path.join(os.path.dirname(__file__), "..", "MaxFlowAirport", "FlightSchedule.csv")
+
+
+def test_schedule_round_trip(tmp_path):
+    path = str(tmp_path / "FlightData.txt")
+    schedule = syntheticSchedule(30, 500, seed=7)
+    writeScheduleData(schedule, path)
+    parsed = readFlightData(path)
+    assert list(parsed) == list(schedule)
+    assert [parsed.aircraftTypes[i] for i in parsed.aircraft] == [schedule.aircraftTypes[i] for i in schedule.aircraft]
+
+
+@pytest.mark.parametrize("columnar", [False, True])
+def test_schedule_without_aircraft_types(tmp_path, columnar):
+    path = str(tmp_path / "FlightData.txt")
+    flights = readSchedule(FLIGHT_SCHEDULE)
+    writeScheduleData(Schedule.fromFlights(flights) if columnar else flights, path)
+    assert list(readFlightData(path)) == flights
+    assert seatCapacity("375 seats") == 375
+
+
+def test_legs_and_schedule_share_the_format(tmp_path):
+    legs = [legRecord("3:20 PM\nLos Angeles International Airport LAX",
+                      "11:40 PM\nJohn F. Kennedy International Airport JFK", "Boeing 767"),
+            legRecord("11:05 PM\nCharlotte Douglas International Airport CLT",
+                      "1:05 AM\nJohn F. Kennedy International Airport JFK", "Boeing 737")]
+    writeFlightData(legs, str(tmp_path / "legs.txt"))
+    writeScheduleData(ScheduleBuilder().extend(legs).schedule(), str(tmp_path / "schedule.txt"))
+    with open(str(tmp_path / "legs.txt")) as legsFile, open(str(tmp_path / "schedule.txt")) as scheduleFile:
+        assert legsFile.read() == scheduleFile.read()
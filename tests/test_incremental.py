@@ -0,0 +1,61 @@
+"""
+Incrementally repaired max flow against a fresh solve of the changed network
+"""
+
+
+import os
+
+import numpy as np
+import pytest
+
+from MaxFlowAirport import IncrementalMaxFlow, ResidualGraph, buildEventNetwork, readFlightData
+
+
+FLIGHT_DATA = os.path.join(os.path.dirname(__file__), "..", "FlightWebscraping", "FlightData.txt")
+
+
+@pytest.fixture(scope="module")
+def network():
+    return buildEventNetwork(readFlightData(FLIGHT_DATA).unique(), "LAX", "JFK")
+
+
+def freshMaxFlow(network, capacity):
+    graph = ResidualGraph(network)
+    residual = [0] * (2 * network.numArcs)
+    residual[0::2] = capacity
+    graph.residual = residual
+    return graph.maxFlow(network.source, network.sink)
+
+
+def checkFlow(network, incremental):
+    flows = incremental.flows()
+    for arc, flow in enumerate(flows):
+        assert 0 <= flow <= incremental.capacity[arc]
+    for node in range(network.numNodes):
+        balance = sum(flows[a] for a in network.incoming(node)) - sum(flows[a] for a in network.outgoing(node))
+        assert balance == {network.source: -incremental.value, network.sink: incremental.value}.get(node, 0)
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_updates_match_fresh_solve(network, seed):
+    rng = np.random.default_rng(seed)
+    incremental = IncrementalMaxFlow(network)
+    assert incremental.value == freshMaxFlow(network, network.capacity.tolist())
+    flights = np.flatnonzero(network.flight >= 0)
+    for batch in range(6):
+        arcs = rng.choice(flights, 3, replace=False)
+        deltas = {int(arc): int(rng.integers(-400, 200)) for arc in arcs}
+        incremental.update(deltas)
+        assert incremental.value == freshMaxFlow(network, incremental.capacity)
+        checkFlow(network, incremental)
+
+
+def test_cancel_and_restore(network):
+    incremental = IncrementalMaxFlow(network)
+    base = incremental.value
+    flights = np.flatnonzero(network.flight >= 0)[:5].tolist()
+    capacity = [incremental.capacity[arc] for arc in flights]
+    assert incremental.cancel(flights) == freshMaxFlow(network, incremental.capacity)
+    assert all(incremental.capacity[arc] == 0 for arc in flights)
+    assert incremental.update(dict(zip(flights, capacity))) == base
+    checkFlow(network, incremental)
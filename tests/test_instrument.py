@@ -0,0 +1,51 @@
+"""
+Phase timing and model size counters of an instrumented solve
+"""
+
+
+import os
+
+import pytest
+
+from MaxFlowAirport import Instrument, buildEventNetwork, buildProblem, modelSize, readFlightData, solve
+
+
+FLIGHT_DATA = os.path.join(os.path.dirname(__file__), "..", "FlightWebscraping", "FlightData.txt")
+
+
+@pytest.fixture(scope="module")
+def network():
+    return buildEventNetwork(readFlightData(FLIGHT_DATA).unique(), "LAX", "JFK")
+
+
+def test_model_size_matches_pulp_problem(network):
+    problem, edges = buildProblem(network)
+    size = modelSize(network)
+    assert size["variables"] == len(edges) == len(problem.variables())
+    assert size["constraints"] == len(problem.constraints)
+    assert size["nonzeros"] == sum(len(constraint) for constraint in problem.constraints.values())
+
+
+@pytest.mark.parametrize("backend", ["pulp", "dinic"])
+def test_instrumented_solve(network, backend):
+    instrument = Instrument()
+    result = solve(network, backend, instrument=instrument)
+    assert result.value == solve(network, backend).value
+    assert instrument.counters["backend"] == backend
+    assert instrument.counters["arcs"] == network.numArcs
+    for name in ("model", "solve", "extract"):
+        record = instrument.phases[name]
+        assert record["calls"] == 1 and record["seconds"] >= 0 and record["peak"] >= 0
+    if backend == "pulp":
+        assert {"write", "cbc", "read"} <= set(instrument.phases)
+    assert "solve" in instrument.summary()
+
+
+def test_nested_phases_accumulate():
+    instrument = Instrument(memory=False)
+    for repeat in range(3):
+        with instrument.phase("outer"):
+            with instrument.phase("inner"):
+                pass
+    assert instrument.phases["outer"]["calls"] == instrument.phases["inner"]["calls"] == 3
+    assert instrument.phases["outer"]["seconds"] >= instrument.phases["inner"]["seconds"]
@@ -0,0 +1,50 @@
+"""
+Passenger itineraries decomposed from a solved flow
+"""
+
+
+import os
+
+import pytest
+
+from MaxFlowAirport import buildEventNetwork, describeItinerary, dinic, itineraries, readFlightData, solve
+from MaxFlowAirport.synthetic import syntheticSchedule
+
+
+FLIGHT_DATA = os.path.join(os.path.dirname(__file__), "..", "FlightWebscraping", "FlightData.txt")
+
+
+def checkItineraries(network, value, flows):
+    carried = [0] * network.numArcs
+    total = 0
+    for itinerary in itineraries(network, flows):
+        assert itinerary.passengers > 0
+        total += itinerary.passengers
+        for arc in itinerary.legs:
+            carried[arc] += itinerary.passengers
+        #consecutive legs connect at the same airport, the second leaving after the first lands
+        for (before, after), (airport, wait) in zip(zip(itinerary.legs, itinerary.legs[1:]), itinerary.layovers):
+            assert network.nodeAirport[network.head[before]] == network.nodeAirport[network.tail[after]]
+            assert network.airports[network.nodeAirport[network.tail[after]]] == airport and wait >= 0
+        assert itinerary.flights == [network.flight[arc] for arc in itinerary.legs]
+        assert describeItinerary(network, itinerary).startswith("%d via " % itinerary.passengers)
+    assert total == value
+    for arc in range(network.numArcs):
+        if network.flight[arc] >= 0:
+            assert carried[arc] == round(flows[arc])
+
+
+@pytest.mark.parametrize("backend", ["dinic", "pulp"])
+def test_passengers_sum_to_flow(backend):
+    network = buildEventNetwork(readFlightData(FLIGHT_DATA).unique(), "LAX", "JFK")
+    result = solve(network, backend)
+    checkItineraries(network, result.value, result.flows)
+
+
+def test_synthetic_schedule():
+    schedule = syntheticSchedule(40, 4000, seed=3)
+    network = buildEventNetwork(schedule, schedule.airports[4], schedule.airports[0], groundCapacity=2000)
+    value, graph = dinic(network)
+    assert value > 0
+    checkItineraries(network, value, graph.flows())
+    assert sum(itinerary.passengers for itinerary in itineraries(network, graph=graph)) == value
@@ -0,0 +1,39 @@
+"""
+Dinic max flow engine against the PuLP linear program
+"""
+
+
+import os
+
+import pytest
+
+from MaxFlowAirport import buildNetwork, readSchedule, solve
+
+
+FLIGHT_SCHEDULE = os.path.join(os.path.dirname(__file__), "..", "MaxFlowAirport", "FlightSchedule.csv")
+
+
+@pytest.fixture(scope="module")
+def flights():
+    return readSchedule(FLIGHT_SCHEDULE)
+
+
+def test_shipped_schedule(flights):
+    network = buildNetwork(flights, "LAX", "JFK", start=1, end=24)
+    assert solve(network, "pulp").value == 4655
+    assert solve(network, "dinic").value == 4655
+
+
+@pytest.mark.parametrize("source, sink", [("LAX", "CLT"), ("SFO", "JFK"), ("LAX", "ATL"), ("JFK", "LAX")])
+def test_dinic_matches_pulp(flights, source, sink):
+    network = buildNetwork(flights, source, sink, start=1, end=24, groundCapacity=500)
+    expected = solve(network, "pulp")
+    result = solve(network, "dinic")
+    assert result.value == expected.value
+    #the flow is feasible and conserved at every node but the source and sink
+    for arc, flow in enumerate(result.flows):
+        assert 0 <= flow <= network.capacity[arc]
+    for node in range(network.numNodes):
+        if node not in (network.source, network.sink):
+            assert (sum(result.flows[a] for a in network.incoming(node)) ==
+                    sum(result.flows[a] for a in network.outgoing(node)))
@@ -0,0 +1,43 @@
+"""
+Multi-commodity flow LP against single commodity max flows
+"""
+
+
+import os
+
+import pytest
+
+from MaxFlowAirport import buildEventNetwork, dinic, multiCommodityFlow, readFlightData
+
+
+FLIGHT_DATA = os.path.join(os.path.dirname(__file__), "..", "FlightWebscraping", "FlightData.txt")
+
+
+@pytest.fixture(scope="module")
+def schedule():
+    return readFlightData(FLIGHT_DATA).unique()
+
+
+@pytest.fixture(scope="module")
+def network(schedule):
+    return buildEventNetwork(schedule, "LAX", "JFK")
+
+
+@pytest.mark.parametrize("source, sink", [("LAX", "JFK"), ("LAX", "CLT"), ("ATL", "JFK")])
+def test_single_commodity_is_max_flow(schedule, network, source, sink):
+    expected, _ = dinic(buildEventNetwork(schedule, source, sink))
+    result = multiCommodityFlow(network, {(source, sink): 10 ** 6})
+    assert result.served[0] == pytest.approx(expected, abs=1e-6)
+    assert result.value == pytest.approx(expected, abs=1e-6)
+
+
+def test_demands_share_seats(schedule, network):
+    alone = {pair: dinic(buildEventNetwork(schedule, *pair))[0] for pair in [("LAX", "JFK"), ("LAX", "CLT")]}
+    small = multiCommodityFlow(network, {("LAX", "JFK"): 100, ("LAX", "CLT"): 50})
+    assert small.served == pytest.approx([100, 50], abs=1e-6)
+    both = multiCommodityFlow(network, {pair: 10 ** 6 for pair in alone})
+    assert both.value <= sum(alone.values()) + 1e-6
+    for served, pair in zip(both.served, alone):
+        assert served <= alone[pair] + 1e-6
+    #every commodity's flow fits in the seats of each arc together
+    assert (both.flows.sum(axis=0).A1 <= network.capacity + 1e-6).all()
@@ -0,0 +1,20 @@
+"""
+Memory held by the compact arrays of a network
+"""
+
+
+import numpy as np
+
+from MaxFlowAirport import buildEventNetwork
+from MaxFlowAirport.synthetic import syntheticSchedule
+
+
+def test_bytes_per_arc():
+    schedule = syntheticSchedule(200, 20000, seed=1)
+    network = buildEventNetwork(schedule, schedule.airports[0], schedule.airports[1])
+    for name in ("nodeAirport", "nodeTime", "tail", "head", "capacity", "flight", "outStart", "outArcs", "inStart",
+                 "inArcs"):
+        assert getattr(network, name).dtype == np.int32, name
+    #24 bytes per arc and 16 per node, plus the closing entries of both CSR start arrays
+    assert network.nbytes <= 24 * network.numArcs + 16 * network.numNodes + 8
+    assert network.bytesPerArc < 40
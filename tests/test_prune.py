@@ -0,0 +1,44 @@
+"""
+Pruned and contracted networks against the networks they were reduced from
+"""
+
+
+import numpy as np
+import pytest
+
+from MaxFlowAirport import buildEventNetwork, buildNetwork, dinic, expandFlows, pruneNetwork, solve
+from MaxFlowAirport.synthetic import syntheticSchedule
+
+
+@pytest.mark.parametrize("groundCapacity", [300, 9999])
+@pytest.mark.parametrize("hourly", [False, True])
+def test_prune_keeps_max_flow(groundCapacity, hourly):
+    schedule = syntheticSchedule(40, 3000, seed=4)
+    for source, sink in [(schedule.airports[3], schedule.airports[0]), (schedule.airports[10], schedule.airports[20])]:
+        if hourly:
+            network = buildNetwork(schedule, source, sink, 0, 1440, groundCapacity, step=60)
+        else:
+            network = buildEventNetwork(schedule, source, sink, 0, 1440, groundCapacity)
+        value, _ = dinic(network)
+        pruned = pruneNetwork(network)
+        assert pruned.report.keptArcs == pruned.network.numArcs < network.numArcs
+        prunedValue, graph = dinic(pruned.network)
+        assert prunedValue == value
+
+        #the expanded flow is feasible on the original network and delivers the same value
+        flows = np.array(expandFlows(pruned, graph.flows()))
+        assert ((flows >= 0) & (flows <= network.capacity)).all()
+        balance = np.bincount(network.head, flows, network.numNodes) - np.bincount(network.tail, flows, network.numNodes)
+        expected = np.zeros(network.numNodes)
+        expected[[network.source, network.sink]] = -value, value
+        assert np.array_equal(balance, expected)
+
+
+@pytest.mark.parametrize("backend", ["dinic", "pulp"])
+def test_solve_with_prune(backend):
+    schedule = syntheticSchedule(20, 600, seed=5)
+    network = buildEventNetwork(schedule, schedule.airports[2], schedule.airports[0])
+    expected = solve(network, backend)
+    result = solve(network, backend, prune=True)
+    assert result.value == pytest.approx(expected.value)
+    assert len(result.flows) == network.numArcs
@@ -0,0 +1,49 @@
+"""
+Minimum cut of a solved flow against its max flow value
+"""
+
+
+import os
+
+import pytest
+
+from MaxFlowAirport import Flight, IncrementalMaxFlow, buildEventNetwork, dinic, minCut, readFlightData, solve
+
+
+FLIGHT_DATA = os.path.join(os.path.dirname(__file__), "..", "FlightWebscraping", "FlightData.txt")
+
+
+@pytest.fixture(scope="module")
+def schedule():
+    return readFlightData(FLIGHT_DATA).unique()
+
+
+@pytest.mark.parametrize("groundCapacity", [300, 9999])
+def test_cut_capacity_is_max_flow(schedule, groundCapacity):
+    network = buildEventNetwork(schedule, "LAX", "JFK", groundCapacity=groundCapacity)
+    value, graph = dinic(network)
+    for report in (minCut(network, graph=graph), minCut(network, flows=solve(network, "pulp").flows)):
+        assert report.capacity == value
+        assert all(cutArc.flow == cutArc.capacity for cutArc in report.arcs)
+        assert sum(report.departures.values()) == pytest.approx(1)
+        assert sum(report.arrivals.values()) == pytest.approx(1)
+
+
+def test_cut_without_capacity():
+    network = buildEventNetwork([Flight("LAX", 420, "JFK", 900, 0)], "LAX", "JFK")
+    value, graph = dinic(network)
+    report = minCut(network, graph=graph)
+    assert value == report.capacity == 0
+    assert [cutArc.flight for cutArc in report.arcs] == [network.flights[0]]
+    assert report.departures == report.arrivals == {}
+
+
+def test_cut_after_incremental_updates(schedule):
+    network = buildEventNetwork(schedule, "LAX", "JFK")
+    incremental = IncrementalMaxFlow(network)
+    flights = [arc for arc in range(network.numArcs) if network.flight[arc] >= 0]
+    for arcs in (flights[:3], flights[3:10], flights):
+        incremental.cancel(arcs)
+        report = minCut(network, graph=incremental.graph)
+        assert report.capacity == incremental.value
+        assert all(cutArc.capacity == incremental.capacity[cutArc.arc] for cutArc in report.arcs)
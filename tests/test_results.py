@@ -0,0 +1,60 @@
+"""
+Memory and disk tiers of the max flow result cache
+"""
+
+
+import os
+
+import numpy as np
+import pytest
+
+from MaxFlowAirport import ResultCache, Schedule, queryMaxFlow, readFlightData
+from MaxFlowAirport.results import resultBytes
+
+
+FLIGHT_DATA = os.path.join(os.path.dirname(__file__), "..", "FlightWebscraping", "FlightData.txt")
+
+
+@pytest.fixture(scope="module")
+def schedule():
+    return readFlightData(FLIGHT_DATA).unique()
+
+
+def sameResult(result, expected):
+    return result.value == expected.value and all(np.array_equal(getattr(result, name), getattr(expected, name))
+                                                  for name in ("flights", "flows", "cut"))
+
+
+def test_memory_and_disk_tiers(schedule, tmp_path):
+    expected = queryMaxFlow(schedule, "LAX", "JFK", excluded=["CLT"])
+    cache = ResultCache(directory=str(tmp_path))
+    assert sameResult(cache.maxFlow(schedule, "LAX", "JFK", excluded=["CLT"]), expected)
+    #the same query in another form is a memory hit
+    assert sameResult(cache.maxFlow(schedule, "LAX", "JFK", (0, 1440), ["CLT", "CLT", "JFK"]), expected)
+    assert (cache.stats()["misses"], cache.stats()["memoryHits"]) == (1, 1)
+
+    other = ResultCache(directory=str(tmp_path))
+    assert sameResult(other.maxFlow(schedule, "LAX", "JFK", excluded=["CLT"]), expected)
+    assert (other.stats()["misses"], other.stats()["diskHits"]) == (0, 1)
+    assert other.maxFlow(schedule, "LAX", "JFK").value == queryMaxFlow(schedule, "LAX", "JFK").value
+
+
+def test_least_recently_used_evicted(schedule):
+    queries = [("LAX", "JFK"), ("LAX", "CLT"), ("ATL", "JFK")]
+    sizes = [resultBytes(queryMaxFlow(schedule, *query)) for query in queries]
+    cache = ResultCache(maxBytes=sizes[0] + sizes[1])
+    cache.maxFlow(schedule, *queries[0])
+    cache.maxFlow(schedule, *queries[1])
+    cache.maxFlow(schedule, *queries[0])
+    cache.maxFlow(schedule, *queries[2])
+    stats = cache.stats()
+    assert stats["evictions"] >= 1 and stats["bytes"] <= sizes[0] + sizes[1]
+    assert cache.key(schedule, *queries[1]) not in cache.entries
+
+
+def test_key_follows_schedule_contents(schedule):
+    cache = ResultCache()
+    changed = Schedule(schedule.airports, schedule.origin, schedule.departure, schedule.destination,
+                       schedule.arrival, schedule.capacity // 2)
+    assert cache.key(schedule, "LAX", "JFK") != cache.key(changed, "LAX", "JFK")
+    assert cache.maxFlow(changed, "LAX", "JFK").value == queryMaxFlow(changed, "LAX", "JFK").value
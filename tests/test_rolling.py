@@ -0,0 +1,22 @@
+"""
+Rolling window max flow against one event network over the whole horizon
+"""
+
+
+import pytest
+
+from MaxFlowAirport import buildEventNetwork, dinic, rollingMaxFlow
+from MaxFlowAirport.synthetic import syntheticSchedule
+
+
+@pytest.mark.parametrize("groundCapacity", [6000, 99999])
+@pytest.mark.parametrize("window", [360, 1440, 5000])
+def test_rolling_matches_full_horizon(groundCapacity, window):
+    end = 3 * 1440
+    schedule = syntheticSchedule(30, 3000, start=0, end=end, seed=2)
+    for source, sink in [(schedule.airports[5], schedule.airports[0]), (schedule.airports[7], schedule.airports[9]),
+                         (schedule.airports[12], schedule.airports[20])]:
+        expected, _ = dinic(buildEventNetwork(schedule, source, sink, 0, end, groundCapacity))
+        result = rollingMaxFlow(schedule, source, sink, 0, end, window, groundCapacity)
+        assert result.value == expected, (source, sink)
+        assert result.windows[0].start == 0
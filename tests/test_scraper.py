@@ -0,0 +1,69 @@
+"""
+Scraper leg parsing, offline replay of result pages and scraping straight into a schedule
+"""
+
+
+from MaxFlowAirport import Flight, readFlightData
+from FlightWebscraping.replay import ReplayBackend, parseLegs, replayPage, writeReplayPage
+from FlightWebscraping.scraper import (Route, legRecord, readPages, scrapeRoutes, scrapeSchedule,
+                                       writeFlightData)
+
+
+LAX = "Los Angeles International Airport LAX"
+JFK = "John F. Kennedy International Airport JFK"
+CLT = "Charlotte Douglas International Airport CLT"
+LAX_JFK = [legRecord("3:20 PM\n" + LAX, "11:40 PM\n" + JFK, "Boeing 767", "Delta DL 1234 Economy"),
+           legRecord("7:00 AM\n" + LAX, "2:10 PM\n" + CLT, "Airbus A321 (Sharklets)", "American AA 88")]
+CLT_JFK = [legRecord("11:05 PM\n" + CLT, "1:05 AM\n" + JFK, "Boeing 737")]
+
+
+def test_leg_record():
+    leg = LAX_JFK[0]
+    assert (leg.departure, leg.origin, leg.originName) == (920, "LAX", "Los Angeles International Airport")
+    assert (leg.arrival, leg.destination, leg.aircraft, leg.flightNumber) == (1420, "JFK", "Boeing 767", "DL1234")
+    #an arrival before the departure lands the next day
+    assert (CLT_JFK[0].departure, CLT_JFK[0].arrival, CLT_JFK[0].flightNumber) == (1385, 1505, None)
+
+
+def test_replay_page_round_trip():
+    assert parseLegs(replayPage(LAX_JFK + CLT_JFK)) == LAX_JFK + CLT_JFK
+
+
+def test_replay_scrape(tmp_path):
+    routes = [Route("LAX", "JFK", "2020-06-19"), Route("CLT", "JFK", "2020-06-19"), Route("SFO", "JFK", "2020-06-19")]
+    writeReplayPage(str(tmp_path), routes[0], LAX_JFK)
+    writeReplayPage(str(tmp_path), routes[1], CLT_JFK)
+    report = scrapeRoutes(routes, ReplayBackend(str(tmp_path)), sessions=2, retries=0)
+    assert report.legs == [LAX_JFK, CLT_JFK, None]
+    assert list(report.errors) == [routes[2]]
+
+
+def test_flight_data_round_trip(tmp_path):
+    path = str(tmp_path / "FlightData.txt")
+    writeFlightData(LAX_JFK + CLT_JFK, path)
+    assert list(readFlightData(path)) == [Flight("LAX", 920, "JFK", 1420, 375), Flight("LAX", 420, "CLT", 850, 240),
+                                          Flight("CLT", 1385, "JFK", 1505, 215)]
+
+
+def test_scrape_schedule(tmp_path):
+    pages, store = str(tmp_path / "pages"), str(tmp_path / "store")
+    routes = [Route("LAX", "JFK", "2020-06-19"), Route("CLT", "JFK", "2020-06-20")]
+    writeReplayPage(pages, routes[0], LAX_JFK)
+    writeReplayPage(pages, routes[1], CLT_JFK)
+    schedule, errors = scrapeSchedule(routes, ReplayBackend(pages), sessions=2, store=store)
+    assert errors == {}
+    #the second date starts a day after the first
+    assert sorted(schedule) == [Flight("CLT", 2825, "JFK", 2945, 215), Flight("LAX", 420, "CLT", 850, 240),
+                                Flight("LAX", 920, "JFK", 1420, 375)]
+    assert sorted(readPages(store)) == [(routes[1], CLT_JFK), (routes[0], LAX_JFK)]
+
+
+def test_unknown_aircraft_page_not_stored(tmp_path):
+    pages, store = str(tmp_path / "pages"), str(tmp_path / "store")
+    routes = [Route("LAX", "JFK", "2020-06-19"), Route("CLT", "JFK", "2020-06-19")]
+    writeReplayPage(pages, routes[0], LAX_JFK)
+    writeReplayPage(pages, routes[1], [CLT_JFK[0]._replace(aircraft="Concorde")])
+    schedule, errors = scrapeSchedule(routes, ReplayBackend(pages), sessions=2, store=store)
+    assert len(schedule) == len(LAX_JFK)
+    assert list(errors) == [routes[1]] and isinstance(errors[routes[1]], KeyError)
+    assert list(readPages(store)) == [(routes[0], LAX_JFK)]
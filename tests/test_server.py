@@ -0,0 +1,72 @@
+"""
+Resident query service, against queryMaxFlow which shares its cache keys, and its HTTP interface
+"""
+
+
+import json
+import os
+import threading
+from urllib.error import HTTPError
+from urllib.request import urlopen
+
+import numpy as np
+import pytest
+
+from MaxFlowAirport import readFlightData
+from MaxFlowAirport.results import queryMaxFlow
+from MaxFlowAirport.server import QueryService, makeServer
+from MaxFlowAirport.synthetic import syntheticSchedule
+
+
+FLIGHT_DATA = os.path.join(os.path.dirname(__file__), "..", "FlightWebscraping", "FlightData.txt")
+
+
+@pytest.fixture(scope="module")
+def server():
+    service = QueryService()
+    service.load("day", readFlightData(FLIGHT_DATA).unique())
+    server = makeServer(service, port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def get(server, path):
+    try:
+        with urlopen("http://127.0.0.1:%d%s" % (server.server_address[1], path)) as response:
+            return response.status, json.loads(response.read())
+    except HTTPError as error:
+        return error.code, json.loads(error.read())
+
+
+def test_http_queries(server):
+    status, body = get(server, "/maxflow?schedule=day&source=LAX&sink=JFK&start=360&end=1440&flights=1")
+    expected = server.service.query("day", "LAX", "JFK", (360, 1440))
+    assert status == 200 and body["value"] == expected.value > 0
+    assert body["cut"] == expected.cut.tolist() and body["flows"] == expected.flows.tolist()
+    assert get(server, "/schedules") == (200, ["day"])
+    status, stats = get(server, "/stats")
+    assert status == 200 and stats["latency"]["count"] >= 1 and stats["schedules"]["day"]["arcs"] > 0
+
+
+def test_http_errors(server):
+    assert get(server, "/maxflow?schedule=week&source=LAX&sink=JFK")[0] == 400
+    assert get(server, "/maxflow?schedule=day&source=LAX")[0] == 400
+    assert get(server, "/unknown")[0] == 404
+
+
+@pytest.mark.parametrize("groundCapacity", [200, 9999])
+def test_query_matches_queryMaxFlow(groundCapacity):
+    schedule = syntheticSchedule(50, 6000, seed=1)
+    service = QueryService(groundCapacity=groundCapacity)
+    service.load("day", schedule)
+    airports = schedule.airports[:5]
+    for source in airports:
+        for sink in airports:
+            for window in [(0, 1440), (360, 1080)]:
+                result = service.query("day", source, sink, window)
+                expected = queryMaxFlow(schedule, source, sink, window, groundCapacity=groundCapacity)
+                assert result.value == expected.value, (source, sink, window)
+                assert np.array_equal(np.sort(result.cut), np.sort(expected.cut)), (source, sink, window)
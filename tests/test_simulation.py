@@ -0,0 +1,31 @@
+"""
+Disruption scenarios on the compiled residual graph against solving each one from scratch
+"""
+
+
+import os
+
+import numpy as np
+
+from MaxFlowAirport import buildEventNetwork, dinic, readFlightData
+from MaxFlowAirport.schedule import Schedule
+from MaxFlowAirport.simulation import Disruptions, sampleScenario, simulateDisruptions
+
+
+FLIGHT_DATA = os.path.join(os.path.dirname(__file__), "..", "FlightWebscraping", "FlightData.txt")
+
+
+def test_delays_on_by_default():
+    assert Disruptions().delayRate == 0.1
+
+
+def test_scenarios_match_dinic():
+    schedule = readFlightData(FLIGHT_DATA)
+    disruptions = Disruptions(cancelRate=0.1, delayRate=0, loadFactor=0.85, loadFactorSpread=0.1)
+    result = simulateDisruptions(schedule, "LAX", "JFK", 20, disruptions, seed=3, processes=1)
+    for index in range(20):
+        rng = np.random.default_rng(np.random.SeedSequence(3, spawn_key=(index,)))
+        seats, departure, arrival = sampleScenario(schedule, disruptions, rng)
+        network = buildEventNetwork(Schedule(schedule.airports, schedule.origin, departure, schedule.destination,
+                                             arrival, seats), "LAX", "JFK", 0, 1440, 9999)
+        assert result.values[index] == dinic(network)[0]
@@ -0,0 +1,70 @@
+"""
+Max flow backends against each other and on networks that carry no flow
+"""
+
+
+import os
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+from MaxFlowAirport import BACKENDS, Instrument, buildEventNetwork, readFlightData, solve
+
+
+FLIGHT_DATA = os.path.join(os.path.dirname(__file__), "..", "FlightWebscraping", "FlightData.txt")
+
+
+@pytest.fixture(scope="module")
+def schedule():
+    return readFlightData(FLIGHT_DATA).unique()
+
+
+@pytest.mark.parametrize("source, sink", [("LAX", "JFK"), ("LAX", "CLT"), ("ATL", "JFK")])
+def test_backends_agree(schedule, source, sink):
+    network = buildEventNetwork(schedule, source, sink, groundCapacity=2000)
+    expected = solve(network, "dinic").value
+    for backend in BACKENDS:
+        instrument = Instrument(memory=False)
+        result = solve(network, backend, instrument=instrument)
+        assert result.value == pytest.approx(expected), backend
+        assert len(result.flows) == network.numArcs
+        assert {"model", "solve", "extract"} <= set(instrument.phases)
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_network_without_arcs(schedule, backend):
+    network = buildEventNetwork(schedule, "JFK", "LAX", 0, 10)
+    assert network.numArcs == 0
+    result = solve(network, backend)
+    assert result.value == 0
+    assert list(result.flows) == []
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_pruned_unreachable_sink(schedule, backend):
+    network = buildEventNetwork(schedule, "JFK", "LAX")
+    result = solve(network, backend, prune=True)
+    assert result.value == 0
+    assert len(result.flows) == network.numArcs and not any(result.flows)
+
+
+def test_scipy_imported_before_timed_phases():
+    #in a fresh interpreter, so that no other test has imported SciPy yet
+    script = textwrap.dedent("""
+        import sys
+        from MaxFlowAirport import Instrument, buildEventNetwork, readFlightData, solve
+
+        class Loaded(Instrument):
+            def phase(self, name):
+                self.count(**{name: "scipy.optimize" in sys.modules and "scipy.sparse" in sys.modules})
+                return Instrument.phase(self, name)
+
+        instrument = Loaded(memory=False)
+        solve(buildEventNetwork(readFlightData(%r), "LAX", "JFK"), "highs", instrument=instrument)
+        print(instrument.counters["model"], instrument.counters["solve"])
+    """) % FLIGHT_DATA
+    root = os.path.join(os.path.dirname(__file__), "..")
+    output = subprocess.run([sys.executable, "-c", script], cwd=root, capture_output=True, text=True, check=True)
+    assert output.stdout.split() == ["True", "True"]